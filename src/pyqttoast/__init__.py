@@ -1 +1,3 @@
-from .toast import Toast, ToastPreset, ToastIcon, ToastPosition, ToastButtonAlignment
+from .toast import Toast, ToastPreset, ToastIcon, ToastPosition, ToastButtonAlignment, ToastRenderMode, ToastFadeBackend, \
+    ToastOverflowPolicy
+from .toast_spec import ToastSpec
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from qtpy.QtCore import QObject, QEvent, Signal
+from qtpy.QtWidgets import QWidget
+from .utils import Utils
+
+
+class AnchorWatcher(QObject):
+
+    # Emitted when the watched widget or one of its parents moves or resizes
+    changed = Signal()
+
+    def __init__(self, parent: QObject | None = None):
+        """Create a new AnchorWatcher instance
+
+        :param parent: the parent object
+        """
+
+        super(AnchorWatcher, self).__init__(parent)
+
+        self.__widget = None
+        self.__watched_widgets = []
+
+    def eventFilter(self, watched, event):
+        # If moved or resized, notify about the geometry change
+        if event.type() == QEvent.Type.Move or event.type() == QEvent.Type.Resize:
+            if watched in self.__watched_widgets:
+                self.changed.emit()
+
+        # One of the parents changed or deleted
+        elif event.type() == QEvent.Type.ParentChange or event.type() == QEvent.Type.DeferredDelete:
+            self.__install_event_filters()
+            if event.type() == QEvent.Type.ParentChange:
+                self.changed.emit()
+
+        return False
+
+    def get_widget(self) -> QWidget | None:
+        """Get the watched widget
+
+        :return: watched widget
+        """
+
+        return self.__widget
+
+    def set_widget(self, widget: QWidget | None):
+        """Set the widget to watch (the widget and all of its parents are watched)
+
+        :param widget: widget to watch (None to stop watching)
+        """
+
+        if widget is self.__widget:
+            return
+
+        self.__widget = widget
+        self.__install_event_filters()
+
+    def __install_event_filters(self):
+        """Install / reinstall the event filters on the widget and its parents"""
+
+        for widget in self.__watched_widgets:
+            widget.removeEventFilter(self)
+        self.__watched_widgets.clear()
+
+        if self.__widget is None:
+            return
+
+        self.__watched_widgets.append(self.__widget)
+        self.__watched_widgets += Utils.get_parents(self.__widget)
+        for widget in self.__watched_widgets:
+            widget.installEventFilter(self)
@@ -1,9 +1,24 @@
+from qtpy.QtCore import Qt, QSize
 from qtpy.QtGui import QColor
 
 
 UPDATE_POSITION_DURATION = 200
-DURATION_BAR_UPDATE_INTERVAL = 1
+DEFAULT_FRAME_RATE = 60
 DROP_SHADOW_SIZE = 5
+DROP_SHADOW_BORDER_RADIUS = 8
+DROP_SHADOW_LAYER_ALPHAS = (3, 5, 6, 9, 10)
+DROP_SHADOW_CACHE_SIZE = 32
+RECOLORED_ICON_CACHE_SIZE = 64
+TEXT_MEASUREMENT_CACHE_SIZE = 512
+BOUNDS_CACHE_SIZE = 16
+QUEUE_SUMMARY_TEXT = '{} more notifications'
+DEFAULT_POOL_SIZE = 10
+MAXIMUM_WIDGET_SIZE = 16777215
+DURATION_BAR_HEIGHT = 4
+DEFAULT_ICON_SIZE = QSize(18, 18)
+DEFAULT_CLOSE_BUTTON_ICON_SIZE = QSize(10, 10)
+TITLE_ALIGNMENT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+TEXT_ALIGNMENT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
 SUCCESS_ACCENT_COLOR = QColor('#3E9141')
 WARNING_ACCENT_COLOR = QColor('#E8B849')
 ERROR_ACCENT_COLOR = QColor('#BA2626')
@@ -1,56 +1,180 @@
+from __future__ import annotations
+
+from collections import OrderedDict
 from qtpy.QtWidgets import QWidget
-from qtpy.QtCore import QSize
-from .utils import Utils
+from qtpy.QtCore import Qt, QSize, QRectF
+from qtpy.QtGui import QPainter, QPixmap, QColor
+from .constants import DROP_SHADOW_BORDER_RADIUS, DROP_SHADOW_LAYER_ALPHAS, DROP_SHADOW_CACHE_SIZE
 
 
 class DropShadow(QWidget):
 
-    def __init__(self, parent: QWidget = None):
+    # Pre-rendered nine-slice sources and composed shadows (least recently used are evicted first)
+    __nine_slice_cache = {}
+    __pixmap_cache = OrderedDict()
+    __pixmap_cache_max_size = DROP_SHADOW_CACHE_SIZE
+
+    def __init__(self, parent: QWidget = None, border_radius: int = DROP_SHADOW_BORDER_RADIUS,
+                 layer_alphas: tuple[int, ...] = DROP_SHADOW_LAYER_ALPHAS):
         """Create a new DropShadow instance
 
         :param parent: the parent widget
+        :param border_radius: border radius of the shadow layers
+        :param layer_alphas: alpha values of the shadow layers (from outermost to innermost)
         """
 
         super(DropShadow, self).__init__(parent)
 
-        # Drawn manually since only one graphics effect can be applied
-        self.layer_1 = QWidget(self)
-        self.layer_1.setObjectName('drop-shadow-layer-1')
+        self.__border_radius = border_radius
+        self.__layer_alphas = tuple(layer_alphas)
+
+    def paintEvent(self, event):
+        """Draw the cached shadow pixmap
+
+        :param event: the event sent by PyQt
+        """
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, DropShadow.get_pixmap(self.size(), self.devicePixelRatioF(),
+                                                       self.__border_radius, self.__layer_alphas))
+        painter.end()
 
-        self.layer_2 = QWidget(self)
-        self.layer_2.setObjectName('drop-shadow-layer-2')
+    @staticmethod
+    def get_pixmap(size: QSize, device_pixel_ratio: float = 1.0,
+                   border_radius: int = DROP_SHADOW_BORDER_RADIUS,
+                   layer_alphas: tuple[int, ...] = DROP_SHADOW_LAYER_ALPHAS) -> QPixmap:
+        """Get a pixmap of the drop shadow. The shadow layers are rendered once
+        into a nine-slice pixmap that is stretched to the requested size,
+        and the results are cached per size, border radius, and device pixel ratio
+
+        :param size: size of the shadow
+        :param device_pixel_ratio: device pixel ratio of the target
+        :param border_radius: border radius of the shadow layers
+        :param layer_alphas: alpha values of the shadow layers (from outermost to innermost)
+        :return: shadow pixmap
+        """
 
-        self.layer_3 = QWidget(self)
-        self.layer_3.setObjectName('drop-shadow-layer-3')
+        layer_alphas = tuple(layer_alphas)
+        key = (size.width(), size.height(), device_pixel_ratio, border_radius, layer_alphas)
 
-        self.layer_4 = QWidget(self)
-        self.layer_4.setObjectName('drop-shadow-layer-4')
+        cache = DropShadow.__pixmap_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
 
-        self.layer_5 = QWidget(self)
-        self.layer_5.setObjectName('drop-shadow-layer-5')
+        pixmap = DropShadow.__create_pixmap(size.width(), size.height(), device_pixel_ratio)
+        painter = QPainter(pixmap)
 
-        # Apply stylesheet
-        self.setStyleSheet(
-            open(Utils.get_current_directory() + '/css/drop_shadow.css').read()
-        )
+        # Size of the corners that cannot be stretched
+        corner_size = len(layer_alphas) + border_radius
+        nine_slice_size = corner_size * 2 + 1
 
-    def resize(self, size: QSize):
-        """Resize the drop shadow widget
+        if size.width() < nine_slice_size or size.height() < nine_slice_size:
+            # Too small to be stretched, so render the layers directly
+            DropShadow.__draw_layers(painter, size.width(), size.height(), border_radius, layer_alphas)
+        else:
+            DropShadow.__draw_nine_slice(painter, size.width(), size.height(), corner_size,
+                                         DropShadow.__get_nine_slice(device_pixel_ratio, border_radius,
+                                                                     layer_alphas, nine_slice_size),
+                                         device_pixel_ratio)
 
-        :param size: new size
+        painter.end()
+
+        cache[key] = pixmap
+        while len(cache) > DropShadow.__pixmap_cache_max_size:
+            cache.popitem(last=False)
+        return pixmap
+
+    @staticmethod
+    def clear_cache():
+        """Remove all pre-rendered shadows from the cache"""
+
+        DropShadow.__nine_slice_cache.clear()
+        DropShadow.__pixmap_cache.clear()
+
+    @staticmethod
+    def __get_nine_slice(device_pixel_ratio: float, border_radius: int,
+                         layer_alphas: tuple[int, ...], nine_slice_size: int) -> QPixmap:
+        """Get the (cached) nine-slice source pixmap of the shadow
+
+        :param device_pixel_ratio: device pixel ratio of the target
+        :param border_radius: border radius of the shadow layers
+        :param layer_alphas: alpha values of the shadow layers
+        :param nine_slice_size: width and height of the nine-slice pixmap
+        :return: nine-slice pixmap
         """
 
-        super().resize(size)
-        width = size.width()
-        height = size.height()
-
-        self.layer_1.resize(width, height)
-        self.layer_1.move(0, 0)
-        self.layer_2.resize(width - 2, height - 2)
-        self.layer_2.move(1, 1)
-        self.layer_3.resize(width - 4, height - 4)
-        self.layer_3.move(2, 2)
-        self.layer_4.resize(width - 6, height - 6)
-        self.layer_4.move(3, 3)
-        self.layer_5.resize(width - 8, height - 8)
-        self.layer_5.move(4, 4)
+        key = (device_pixel_ratio, border_radius, layer_alphas)
+
+        if key not in DropShadow.__nine_slice_cache:
+            nine_slice = DropShadow.__create_pixmap(nine_slice_size, nine_slice_size, device_pixel_ratio)
+            painter = QPainter(nine_slice)
+            DropShadow.__draw_layers(painter, nine_slice_size, nine_slice_size, border_radius, layer_alphas)
+            painter.end()
+            DropShadow.__nine_slice_cache[key] = nine_slice
+
+        return DropShadow.__nine_slice_cache[key]
+
+    @staticmethod
+    def __create_pixmap(width: int, height: int, device_pixel_ratio: float) -> QPixmap:
+        """Create a transparent pixmap with a device pixel ratio
+
+        :param width: width in device independent pixels
+        :param height: height in device independent pixels
+        :param device_pixel_ratio: device pixel ratio
+        :return: transparent pixmap
+        """
+
+        pixmap = QPixmap(round(width * device_pixel_ratio), round(height * device_pixel_ratio))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+
+    @staticmethod
+    def __draw_layers(painter: QPainter, width: int, height: int,
+                      border_radius: int, layer_alphas: tuple[int, ...]):
+        """Draw the shadow layers (each layer is inset by one pixel)
+
+        :param painter: painter to draw with
+        :param width: width of the shadow
+        :param height: height of the shadow
+        :param border_radius: border radius of the shadow layers
+        :param layer_alphas: alpha values of the shadow layers
+        """
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        for i, alpha in enumerate(layer_alphas):
+            painter.setBrush(QColor(0, 0, 0, alpha))
+            painter.drawRoundedRect(QRectF(i, i, width - i * 2, height - i * 2),
+                                    border_radius, border_radius)
+
+    @staticmethod
+    def __draw_nine_slice(painter: QPainter, width: int, height: int, corner_size: int,
+                          nine_slice: QPixmap, device_pixel_ratio: float):
+        """Draw a nine-slice pixmap stretched to a size
+
+        :param painter: painter to draw with
+        :param width: target width
+        :param height: target height
+        :param corner_size: size of the corners that are not stretched
+        :param nine_slice: nine-slice source pixmap
+        :param device_pixel_ratio: device pixel ratio of the source pixmap
+        """
+
+        # Columns and rows as (target position, target size, source position, source size)
+        columns = [(0, corner_size, 0, corner_size),
+                   (corner_size, width - corner_size * 2, corner_size, 1),
+                   (width - corner_size, corner_size, corner_size + 1, corner_size)]
+        rows = [(0, corner_size, 0, corner_size),
+                (corner_size, height - corner_size * 2, corner_size, 1),
+                (height - corner_size, corner_size, corner_size + 1, corner_size)]
+
+        for target_x, target_width, source_x, source_width in columns:
+            for target_y, target_height, source_y, source_height in rows:
+                painter.drawPixmap(QRectF(target_x, target_y, target_width, target_height),
+                                   nine_slice,
+                                   QRectF(source_x * device_pixel_ratio, source_y * device_pixel_ratio,
+                                          source_width * device_pixel_ratio,
+                                          source_height * device_pixel_ratio))
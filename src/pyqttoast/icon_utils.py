@@ -1,12 +1,31 @@
 from __future__ import annotations
 
-from qtpy.QtGui import QPixmap, QColor, QImage, qRgba
+from collections import OrderedDict
+from qtpy.QtCore import Qt, QSize
+from qtpy.QtGui import QGuiApplication, QPixmap, QColor, QImage, QPainter
 from .toast_enums import ToastIcon
 from .utils import Utils
+from .constants import RECOLORED_ICON_CACHE_SIZE
 
 
 class IconUtils:
 
+    # Registry of icons (bundled icons are loaded lazily)
+    __icons = {}
+    __icon_file_names = {
+        ToastIcon.SUCCESS: 'success.png',
+        ToastIcon.WARNING: 'warning.png',
+        ToastIcon.ERROR: 'error.png',
+        ToastIcon.INFORMATION: 'information.png',
+        ToastIcon.CLOSE: 'close.png'
+    }
+
+    # Cache of recolored pixmaps (least recently used entries are evicted first)
+    __recolored_cache = OrderedDict()
+    __recolored_cache_max_size = RECOLORED_ICON_CACHE_SIZE
+    __recolored_cache_hits = 0
+    __recolored_cache_misses = 0
+
     @staticmethod
     def get_icon_from_enum(enum_icon: ToastIcon):
         """Get a QPixmap from a ToastIcon
@@ -15,16 +34,61 @@ class IconUtils:
         :return: pixmap of the ToastIcon
         """
 
-        if enum_icon == ToastIcon.SUCCESS:
-            return QPixmap(Utils.get_current_directory() + '/icons/success.png')
-        elif enum_icon == ToastIcon.WARNING:
-            return QPixmap(Utils.get_current_directory() + '/icons/warning.png')
-        elif enum_icon == ToastIcon.ERROR:
-            return QPixmap(Utils.get_current_directory() + '/icons/error.png')
-        elif enum_icon == ToastIcon.INFORMATION:
-            return QPixmap(Utils.get_current_directory() + '/icons/information.png')
-        elif enum_icon == ToastIcon.CLOSE:
-            return QPixmap(Utils.get_current_directory() + '/icons/close.png')
+        return IconUtils.get_icon(enum_icon)
+
+    @staticmethod
+    def get_icon(icon: ToastIcon | str) -> QPixmap:
+        """Get a QPixmap from a ToastIcon or the name of a registered icon.
+        Bundled icons are only loaded from disk the first time they are used,
+        and the returned pixmaps share their data with the registry
+
+        :param icon: ToastIcon or name of a registered icon
+        :return: pixmap of the icon
+        """
+
+        if icon not in IconUtils.__icons:
+            if icon not in IconUtils.__icon_file_names:
+                raise ValueError('Icon \'{}\' is not registered'.format(icon))
+
+            IconUtils.__icons[icon] = QPixmap(Utils.get_current_directory()
+                                              + '/icons/' + IconUtils.__icon_file_names[icon])
+
+        return QPixmap(IconUtils.__icons[icon])
+
+    @staticmethod
+    def register_icon(name: str, icon: QPixmap | str):
+        """Register a custom icon so it can be used by name.
+        Registered names take precedence over file paths with the same string
+
+        :param name: name of the icon
+        :param icon: pixmap or path of the icon
+        """
+
+        pixmap = QPixmap(icon)
+        if pixmap.isNull():
+            raise ValueError('Icon \'{}\' could not be loaded'.format(name))
+
+        IconUtils.__icons[name] = pixmap
+
+    @staticmethod
+    def unregister_icon(name: str):
+        """Remove a registered custom icon (bundled icons cannot be removed)
+
+        :param name: name of the icon
+        """
+
+        if name not in IconUtils.__icon_file_names:
+            IconUtils.__icons.pop(name, None)
+
+    @staticmethod
+    def is_icon_registered(name: str) -> bool:
+        """Get whether a custom icon is registered under a name
+
+        :param name: name of the icon
+        :return: whether the icon is registered
+        """
+
+        return name in IconUtils.__icons
 
     @staticmethod
     def recolor_image(image: QImage, color: QColor | None):
@@ -39,16 +103,116 @@ class IconUtils:
         if color is None:
             return image
 
-        # Loop through every pixel
-        for x in range(0, image.width()):
-            for y in range(0, image.height()):
-                # Get current color of the pixel
-                current_color = image.pixelColor(x, y)
-                # Replace the rgb values with rgb of new color and keep alpha the same
-                new_color_r = color.red()
-                new_color_g = color.green()
-                new_color_b = color.blue()
-                new_color = QColor.fromRgba(
-                    qRgba(new_color_r, new_color_g, new_color_b, current_color.alpha()))
-                image.setPixelColor(x, y, new_color)
-        return image
+        # Fill the whole buffer with the new color in one pass while keeping
+        # the alpha channel of the original image (SourceIn composition)
+        recolored_image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        painter = QPainter(recolored_image)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(recolored_image.rect(), QColor(color.red(), color.green(), color.blue()))
+        painter.end()
+        return recolored_image
+
+    @staticmethod
+    def get_recolored_pixmap(pixmap: QPixmap, size: QSize, color: QColor | None,
+                             device_pixel_ratio: float | None = None) -> QPixmap:
+        """Get a scaled and recolored copy of a pixmap. Results are cached by
+        source pixmap, size, color, and device pixel ratio, so recoloring the
+        same icon again does not do any image processing
+
+        :param pixmap: source pixmap
+        :param size: target size
+        :param color: new color (None if the pixmap should not be recolored)
+        :param device_pixel_ratio: device pixel ratio (None to use the one of the application)
+        :return: recolored pixmap
+        """
+
+        if device_pixel_ratio is None:
+            device_pixel_ratio = QGuiApplication.instance().devicePixelRatio()
+
+        key = (pixmap.cacheKey(), size.width(), size.height(),
+               None if color is None else color.rgb(), device_pixel_ratio)
+
+        cache = IconUtils.__recolored_cache
+        if key in cache:
+            IconUtils.__recolored_cache_hits += 1
+            cache.move_to_end(key)
+            return cache[key]
+
+        IconUtils.__recolored_cache_misses += 1
+        recolored_pixmap = QPixmap(IconUtils.recolor_image(
+            IconUtils.__scale_pixmap(pixmap, size, device_pixel_ratio).toImage(), color))
+        recolored_pixmap.setDevicePixelRatio(device_pixel_ratio)
+
+        cache[key] = recolored_pixmap
+        while len(cache) > IconUtils.__recolored_cache_max_size:
+            cache.popitem(last=False)
+        return recolored_pixmap
+
+    @staticmethod
+    def __scale_pixmap(pixmap: QPixmap, size: QSize, device_pixel_ratio: float) -> QPixmap:
+        """Scale a pixmap down to fit into a size in device pixels (like QIcon does, never scaled up)
+
+        :param pixmap: source pixmap
+        :param size: target size in device independent pixels
+        :param device_pixel_ratio: device pixel ratio of the target
+        :return: scaled pixmap
+        """
+
+        device_size = QSize(round(size.width() * device_pixel_ratio),
+                            round(size.height() * device_pixel_ratio))
+        scaled_size = pixmap.size()
+
+        if scaled_size.width() > device_size.width() or scaled_size.height() > device_size.height():
+            scaled_size.scale(device_size, Qt.AspectRatioMode.KeepAspectRatio)
+
+        if scaled_size == pixmap.size():
+            return pixmap
+        return pixmap.scaled(scaled_size, Qt.AspectRatioMode.IgnoreAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+
+    @staticmethod
+    def get_cache_max_size() -> int:
+        """Get the maximum amount of recolored pixmaps that are cached
+
+        :return: maximum cache size
+        """
+
+        return IconUtils.__recolored_cache_max_size
+
+    @staticmethod
+    def set_cache_max_size(max_size: int):
+        """Set the maximum amount of recolored pixmaps that are cached
+
+        :param max_size: new maximum cache size
+        """
+
+        IconUtils.__recolored_cache_max_size = max_size
+
+        while len(IconUtils.__recolored_cache) > max_size:
+            IconUtils.__recolored_cache.popitem(last=False)
+
+    @staticmethod
+    def get_cache_hits() -> int:
+        """Get the amount of recolored pixmaps that were served from the cache
+
+        :return: cache hits
+        """
+
+        return IconUtils.__recolored_cache_hits
+
+    @staticmethod
+    def get_cache_misses() -> int:
+        """Get the amount of recolored pixmaps that had to be created
+
+        :return: cache misses
+        """
+
+        return IconUtils.__recolored_cache_misses
+
+    @staticmethod
+    def clear_cache():
+        """Remove all recolored pixmaps from the cache and reset the counters"""
+
+        IconUtils.__recolored_cache.clear()
+        IconUtils.__recolored_cache_hits = 0
+        IconUtils.__recolored_cache_misses = 0
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, NamedTuple
+from .toast_enums import ToastButtonAlignment, ToastPosition
+
+
+class LayoutMargins(NamedTuple):
+    left: int = 0
+    top: int = 0
+    right: int = 0
+    bottom: int = 0
+
+
+class LayoutRect(NamedTuple):
+    x: int = 0
+    y: int = 0
+    width: int = 0
+    height: int = 0
+
+
+class ToastLayoutOptions(NamedTuple):
+    margins: LayoutMargins
+    icon_margins: LayoutMargins
+    icon_section_margins: LayoutMargins
+    text_section_margins: LayoutMargins
+    close_button_margins: LayoutMargins
+    icon_size: tuple[int, int]
+    icon_separator_width: int
+    close_button_size: tuple[int, int]
+    close_button_alignment: ToastButtonAlignment
+    text_section_spacing: int
+    duration_bar_height: int
+    show_icon: bool
+    show_close_button: bool
+    has_title: bool
+    has_text: bool
+    minimum_size: tuple[int, int]
+    maximum_size: tuple[int, int]
+
+
+class ToastLayout(NamedTuple):
+    width: int
+    height: int
+    icon: LayoutRect
+    icon_separator: LayoutRect
+    title: LayoutRect
+    text: LayoutRect
+    close_button: LayoutRect
+    duration_bar: LayoutRect
+    word_wrap: bool
+
+
+class LayoutUtils:
+
+    @staticmethod
+    def calculate_toast_layout(options: ToastLayoutOptions,
+                               title_size: tuple[int, int],
+                               text_size: tuple[int, int],
+                               measure_wrapped: Callable[[int], tuple[int, int, int, int]]) -> ToastLayout:
+        """Calculate the best toast size and the geometry of all toast sections.
+        This does not depend on Qt or on any widget, the text measurements are provided by the caller
+
+        :param options: margins, section sizes, and size constraints of the toast
+        :param title_size: width and height of the title on a single line
+        :param text_size: width and height of the text on a single line
+        :param measure_wrapped: returns title width, title height, text width, and text height
+            when word wrapped at the given width (must not have any side effects)
+        :return: layout of the toast (positions are relative to the toast content)
+        """
+
+        margins = options.margins
+        icon_margins = options.icon_margins
+        icon_section_margins = options.icon_section_margins
+        text_section_margins = options.text_section_margins
+        icon_width, icon_height = options.icon_size
+        minimum_width, minimum_height = options.minimum_size
+        maximum_width, maximum_height = options.maximum_size
+        duration_bar_height = options.duration_bar_height
+        word_wrap = False
+
+        # Calculate title and text width and height
+        title_width, title_height = title_size
+        text_width, text_height = text_size
+        text_section_spacing = options.text_section_spacing
+        if not options.has_title or not options.has_text:
+            text_section_spacing = 0
+
+        def calculate_text_section_height(title_height: int, text_height: int) -> int:
+            return (text_section_margins.top + title_height + text_section_spacing
+                    + text_height + text_section_margins.bottom)
+
+        text_section_height = calculate_text_section_height(title_height, text_height)
+
+        # Calculate icon section width and height
+        icon_section_width = 0
+        icon_section_height = 0
+
+        if options.show_icon:
+            icon_section_width = (icon_section_margins.left + icon_margins.left + icon_width
+                                  + icon_margins.right + options.icon_separator_width
+                                  + icon_section_margins.right)
+            icon_section_height = (icon_section_margins.top + icon_margins.top + icon_height
+                                   + icon_margins.bottom + icon_section_margins.bottom)
+
+        # Calculate close button section height
+        close_button_width, close_button_height = (options.close_button_size
+                                                   if options.show_close_button else (0, 0))
+        close_button_margins = (options.close_button_margins
+                                if options.show_close_button else LayoutMargins())
+
+        close_button_section_height = (close_button_margins.top
+                                       + close_button_height
+                                       + close_button_margins.bottom)
+
+        def calculate_width(title_width: int, text_width: int) -> int:
+            return (margins.left + icon_section_width + text_section_margins.left
+                    + max(title_width, text_width) + text_section_margins.right
+                    + close_button_margins.left + close_button_width
+                    + close_button_margins.right + margins.right)
+
+        def calculate_height(text_section_height: int) -> int:
+            return (margins.top
+                    + max(icon_section_height, text_section_height, close_button_section_height)
+                    + margins.bottom + duration_bar_height)
+
+        # Calculate needed width and height
+        width = calculate_width(title_width, text_width)
+        height = calculate_height(text_section_height)
+
+        forced_additional_height = 0
+        forced_reduced_height = 0
+
+        # Handle width greater than maximum width
+        if width > maximum_width:
+            # Enable line break for title and text and recalculate size
+            word_wrap = True
+            new_title_text_width = max(title_width, text_width) - (width - maximum_width)
+            if new_title_text_width > 0:
+                title_width = new_title_text_width
+                text_width = new_title_text_width
+
+            if options.has_title:
+                title_height = measure_wrapped(title_width)[1]
+            if options.has_text:
+                text_height = measure_wrapped(text_width)[3]
+
+            # Recalculate width and height
+            width = maximum_width
+            text_section_height = calculate_text_section_height(title_height, text_height)
+            height = calculate_height(text_section_height)
+
+        # Handle height less than minimum height
+        if height < minimum_height:
+            word_wrap = True
+
+            # Calculate height with initial label width
+            title_width, _, text_width, _ = measure_wrapped(0)
+            temp_width = max(title_width, text_width)
+
+            title_width, wrapped_title_height, text_width, wrapped_text_height = measure_wrapped(temp_width)
+            if options.has_title:
+                title_height = wrapped_title_height
+            if options.has_text:
+                text_height = wrapped_text_height
+
+            text_section_height = calculate_text_section_height(title_height, text_height)
+            height = calculate_height(text_section_height)
+
+            def calculate_wrapped_section(wrap_width: int) -> tuple[int, int, int, int, int, int]:
+                temp_title_width, temp_title_height, temp_text_width, temp_text_height = (
+                    measure_wrapped(wrap_width))
+
+                if not options.has_title:
+                    temp_title_height = 0
+
+                if not options.has_text:
+                    temp_text_height = 0
+
+                temp_text_section_height = calculate_text_section_height(temp_title_height, temp_text_height)
+                temp_height = calculate_height(temp_text_section_height)
+
+                return (temp_title_width, temp_title_height, temp_text_width,
+                        temp_text_height, temp_text_section_height, temp_height)
+
+            # Find the greatest width at which the min height is still met
+            # (height can only decrease with increasing width, so use a binary search)
+            lower_width = temp_width
+            upper_width = width
+            best_section = None
+
+            while lower_width <= upper_width:
+                middle_width = (lower_width + upper_width) // 2
+                section = calculate_wrapped_section(middle_width)
+
+                if section[5] >= minimum_height:
+                    best_section = section
+                    lower_width = middle_width + 1
+                else:
+                    upper_width = middle_width - 1
+
+            # Store values if calculated height is greater than or equal to min height
+            if best_section is not None:
+                (title_width, title_height, text_width,
+                 text_height, text_section_height, height) = best_section
+
+            # Recalculate width
+            width = calculate_width(title_width, text_width)
+
+            # If min height not met, set height to min height
+            if height < minimum_height:
+                forced_additional_height = minimum_height - height
+                height = minimum_height
+
+        # Handle width less than minimum width
+        if width < minimum_width:
+            width = minimum_width
+
+        # Handle height greater than maximum height
+        if height > maximum_height:
+            forced_reduced_height = height - maximum_height
+            height = maximum_height
+
+        # Calculate max height of all sections
+        max_section_height = max(icon_section_height, text_section_height, close_button_section_height)
+
+        # Calculate difference between height and height of icon section and text section
+        height_icon_section_height_difference = max_section_height - icon_section_height
+        height_text_section_height_difference = max_section_height - text_section_height
+        forced_height_difference = (math.ceil(forced_additional_height / 2)
+                                    - math.floor(forced_reduced_height / 2))
+
+        # Calculate icon and icon separator geometry
+        icon_rect = LayoutRect()
+        icon_separator_rect = LayoutRect()
+        text_section_x = margins.left + text_section_margins.left
+
+        if options.show_icon:
+            icon_rect = LayoutRect(margins.left + icon_section_margins.left + icon_margins.left,
+                                   margins.top + icon_section_margins.top + icon_margins.top
+                                   + math.ceil(height_icon_section_height_difference / 2)
+                                   + forced_height_difference,
+                                   icon_width, icon_height)
+
+            icon_separator_rect = LayoutRect(icon_rect.x + icon_width + icon_margins.right,
+                                             margins.top + icon_section_margins.top
+                                             + math.ceil(height_text_section_height_difference / 2)
+                                             + forced_height_difference,
+                                             options.icon_separator_width, text_section_height)
+
+            text_section_x = (icon_separator_rect.x + options.icon_separator_width
+                              + icon_section_margins.right + text_section_margins.left)
+
+        # Calculate title and text geometry
+        label_width = max(title_width, text_width)
+        title_y = (margins.top + text_section_margins.top
+                   + math.ceil(height_text_section_height_difference / 2)
+                   + forced_height_difference)
+        text_y = title_y + title_height + options.text_section_spacing
+
+        # Adjust label position if either title or text is empty
+        if not options.has_title and options.has_text:
+            text_y = int((height - text_height - duration_bar_height) / 2)
+
+        elif options.has_title and not options.has_text:
+            title_y = int((height - title_height - duration_bar_height) / 2)
+
+        # Calculate close button geometry (top, middle, or bottom position)
+        close_button_x = width - close_button_width - close_button_margins.right - margins.right
+        close_button_y = 0
+
+        if options.close_button_alignment == ToastButtonAlignment.TOP:
+            close_button_y = margins.top + close_button_margins.top
+        elif options.close_button_alignment == ToastButtonAlignment.MIDDLE:
+            close_button_y = math.ceil((height - close_button_height - duration_bar_height) / 2)
+        elif options.close_button_alignment == ToastButtonAlignment.BOTTOM:
+            close_button_y = (height - close_button_height - margins.bottom
+                              - close_button_margins.bottom - duration_bar_height)
+
+        return ToastLayout(
+            width=width,
+            height=height,
+            icon=icon_rect,
+            icon_separator=icon_separator_rect,
+            title=LayoutRect(text_section_x, title_y, label_width, title_height),
+            text=LayoutRect(text_section_x, text_y, label_width, text_height),
+            close_button=LayoutRect(close_button_x, close_button_y, *options.close_button_size),
+            duration_bar=LayoutRect(0, height - duration_bar_height, width, duration_bar_height),
+            word_wrap=word_wrap
+        )
+
+    @staticmethod
+    def calculate_stack_positions(position: ToastPosition,
+                                  toast_sizes: list[tuple[int, int]],
+                                  bounds: list[LayoutRect],
+                                  spacing: int,
+                                  offset: tuple[int, int],
+                                  drop_shadow_size: int) -> list[tuple[int, int]]:
+        """Calculate the positions of stacked toasts in one pass
+        (the vertical offset of each toast is the prefix sum of the heights before it)
+
+        :param position: position of the stack
+        :param toast_sizes: width and height of the toast content of every toast in stack order
+        :param bounds: rect of the target screen or widget of every toast
+        :param spacing: spacing between the toasts
+        :param offset: x and y offset of the stack
+        :param drop_shadow_size: size of the drop shadow around the toast content
+        :return: x and y position of every toast
+        """
+
+        offset_x, offset_y = offset
+        positions = []
+        y_offset = 0
+
+        for (width, height), rect in zip(toast_sizes, bounds):
+            x = 0
+            y = 0
+
+            if position == ToastPosition.BOTTOM_RIGHT:
+                x = rect.width - width - offset_x + rect.x
+                y = rect.height - height - offset_y + rect.y - y_offset
+
+            elif position == ToastPosition.BOTTOM_LEFT:
+                x = rect.x + offset_x
+                y = rect.height - height - offset_y + rect.y - y_offset
+
+            elif position == ToastPosition.BOTTOM_MIDDLE:
+                x = rect.x + rect.width / 2 - width / 2
+                y = rect.height - height - offset_y + rect.y - y_offset
+
+            elif position == ToastPosition.TOP_RIGHT:
+                x = rect.width - width - offset_x + rect.x
+                y = rect.y + offset_y + y_offset
+
+            elif position == ToastPosition.TOP_LEFT:
+                x = rect.x + offset_x
+                y = rect.y + offset_y + y_offset
+
+            elif position == ToastPosition.TOP_MIDDLE:
+                x = rect.x + rect.width / 2 - width / 2
+                y = rect.y + offset_y + y_offset
+
+            elif position == ToastPosition.CENTER:
+                # Stack starts at the center of the first toast
+                x = rect.x + rect.width / 2 - width / 2
+                y = rect.y + rect.height / 2 - toast_sizes[0][1] / 2 + y_offset
+
+            positions.append((int(x - drop_shadow_size), int(y - drop_shadow_size)))
+            y_offset += height + spacing
+
+        return positions
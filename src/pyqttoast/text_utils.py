@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from qtpy.QtCore import Qt, QRect
+from qtpy.QtGui import QFont, QFontMetrics
+from .constants import TEXT_MEASUREMENT_CACHE_SIZE
+
+
+class TextUtils:
+
+    # Cache of text measurements (least recently used entries are evicted first)
+    __measurements = OrderedDict()
+    __measurements_max_size = TEXT_MEASUREMENT_CACHE_SIZE
+    __measurements_hits = 0
+    __measurements_misses = 0
+
+    # Font metrics by font key
+    __font_metrics = {}
+
+    @staticmethod
+    def get_text_width(font: QFont, text: str) -> int:
+        """Get the width of a single line text
+
+        :param font: font of the text
+        :param text: text to measure
+        :return: width
+        """
+
+        return TextUtils.__measure(font, text, None)[0]
+
+    @staticmethod
+    def get_text_height(font: QFont, text: str) -> int:
+        """Get the height of the bounding rect of a single line text
+
+        :param font: font of the text
+        :param text: text to measure
+        :return: height
+        """
+
+        return TextUtils.__measure(font, text, None)[1]
+
+    @staticmethod
+    def get_wrapped_text_size(font: QFont, text: str, width: int) -> tuple[int, int]:
+        """Get the width and height of the bounding rect of a text
+        that is word wrapped at the given width
+
+        :param font: font of the text
+        :param text: text to measure
+        :param width: width at which the text is wrapped
+        :return: width and height
+        """
+
+        return TextUtils.__measure(font, text, width)
+
+    @staticmethod
+    def __measure(font: QFont, text: str, width: int | None) -> tuple[int, int]:
+        """Measure a text (unwrapped if width is None) and cache the result
+
+        :param font: font of the text
+        :param text: text to measure
+        :param width: width at which the text is wrapped (None if not wrapped)
+        :return: width and height
+        """
+
+        font_key = font.key()
+        key = (font_key, text, width)
+
+        measurements = TextUtils.__measurements
+        if key in measurements:
+            TextUtils.__measurements_hits += 1
+            measurements.move_to_end(key)
+            return measurements[key]
+
+        TextUtils.__measurements_misses += 1
+
+        font_metrics = TextUtils.__font_metrics.get(font_key)
+        if font_metrics is None:
+            font_metrics = QFontMetrics(font)
+            TextUtils.__font_metrics[font_key] = font_metrics
+
+        if width is None:
+            size = (font_metrics.width(text), font_metrics.boundingRect(text).height())
+        else:
+            rect = font_metrics.boundingRect(QRect(0, 0, width, 0), Qt.TextFlag.TextWordWrap, text)
+            size = (rect.width(), rect.height())
+
+        measurements[key] = size
+        while len(measurements) > TextUtils.__measurements_max_size:
+            measurements.popitem(last=False)
+        return size
+
+    @staticmethod
+    def get_cache_max_size() -> int:
+        """Get the maximum amount of text measurements that are cached
+
+        :return: maximum cache size
+        """
+
+        return TextUtils.__measurements_max_size
+
+    @staticmethod
+    def set_cache_max_size(max_size: int):
+        """Set the maximum amount of text measurements that are cached
+
+        :param max_size: new maximum cache size
+        """
+
+        TextUtils.__measurements_max_size = max_size
+
+        while len(TextUtils.__measurements) > max_size:
+            TextUtils.__measurements.popitem(last=False)
+
+    @staticmethod
+    def get_cache_hits() -> int:
+        """Get the amount of text measurements that were served from the cache
+
+        :return: cache hits
+        """
+
+        return TextUtils.__measurements_hits
+
+    @staticmethod
+    def get_cache_misses() -> int:
+        """Get the amount of text measurements that had to be calculated
+
+        :return: cache misses
+        """
+
+        return TextUtils.__measurements_misses
+
+    @staticmethod
+    def clear_cache():
+        """Remove all text measurements from the cache and reset the counters"""
+
+        TextUtils.__measurements.clear()
+        TextUtils.__font_metrics.clear()
+        TextUtils.__measurements_hits = 0
+        TextUtils.__measurements_misses = 0
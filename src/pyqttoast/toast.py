@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 import math
+import threading
+from typing import Callable, Iterable
+from collections import OrderedDict, deque
+from itertools import islice
 from qtpy.QtGui import QGuiApplication, QScreen
-from qtpy.QtCore import Qt, QPropertyAnimation, QPoint, QTimer, QSize, QMargins, QRect, Signal
-from qtpy.QtGui import QPixmap, QIcon, QFont, QFontMetrics
+from qtpy.QtCore import Qt, QPropertyAnimation, QParallelAnimationGroup, QPoint, QTimer, QSize, QMargins, QRect, QRectF, QElapsedTimer, Signal
+from qtpy.QtGui import QPixmap, QIcon, QFont, QFontInfo, QPainter, QPainterPath
 from qtpy.QtWidgets import QDialog, QPushButton, QLabel, QGraphicsOpacityEffect, QWidget
-from .toast_enums import ToastPreset, ToastIcon, ToastPosition, ToastButtonAlignment
+from .toast_enums import ToastPreset, ToastIcon, ToastPosition, ToastButtonAlignment, ToastRenderMode, ToastFadeBackend, \
+    ToastOverflowPolicy
 from .utils import Utils
 from .icon_utils import IconUtils
+from .text_utils import TextUtils
+from .layout_utils import LayoutUtils, LayoutMargins, LayoutRect, ToastLayoutOptions, ToastLayout
 from .drop_shadow import DropShadow
+from .anchor_watcher import AnchorWatcher
+from .toast_spec import ToastSpec
+from .toast_inbox import ToastInbox
 from .constants import *
 
 
@@ -24,9 +34,43 @@ class Toast(QDialog):
     __always_on_main_screen = False
     __fixed_screen = None
     __position = ToastPosition.BOTTOM_RIGHT
+    __frame_rate = 0
+    __fade_backend = ToastFadeBackend.GRAPHICS_EFFECT
 
-    __currently_shown = []
-    __queue = []
+    __maximum_queue_size = 0
+    __queue_overflow_policy = ToastOverflowPolicy.DROP_OLDEST
+
+    __currently_shown = OrderedDict()
+    __queue = deque()
+    __dropped_count = 0
+    __queue_summary_toast = None
+    __queue_summary_count = 0
+
+    # Shared timer updating the duration bars of all animated toasts
+    __duration_bar_ticker = None
+    __animated_duration_bars = {}
+
+    # Shared animation group moving all currently shown toasts
+    __restack_animation = None
+
+    # Cached bounds of the target screens / widget (least recently used are evicted first)
+    __bounds_cache = OrderedDict()
+    __screen_signals_connected = False
+
+    # Shared watcher of the widget the position is relative to (and its parents)
+    __anchor_watcher = None
+    __coalesce_widget_events = False
+    __coalesce_timer = None
+
+    # Pool of closed toasts that can be reused
+    __pool = []
+    __pool_size = DEFAULT_POOL_SIZE
+    __pool_created_count = 0
+    __pool_reused_count = 0
+
+    # Inbox for toast specs posted from any thread
+    __inbox = None
+    __inbox_lock = threading.Lock()
 
     # Close event
     closed = Signal()
@@ -40,18 +84,64 @@ class Toast(QDialog):
         super(Toast, self).__init__(parent)
 
         # Init attributes
+        self.__init_attributes()
+        self.__pooled = False
+
+        # Window settings
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+        # Toast widget (QLabel because QWidget has weird behaviour with stylesheets)
+        self.__toast_widget = QLabel(self)
+
+        # Drop shadow
+        self.__drop_shadow = DropShadow(self)
+
+        # Close button
+        self.__close_button = QPushButton(self.__toast_widget)
+        self.__close_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.__close_button.clicked.connect(self.hide)
+        self.__close_button.setObjectName('toast-close-button')
+
+        # Title, text, icon, icon separator, and duration bar widgets are only
+        # created when the toast is shown in widget mode (see __create_content_widgets)
+        self.__title_label = None
+        self.__text_label = None
+        self.__icon_widget = None
+        self.__icon_separator = None
+        self.__duration_bar_container = None
+        self.__duration_bar = None
+        self.__duration_bar_chunk = None
+
+        # Set defaults
+        self.__apply_attributes()
+
+        # Position animation (retargeted and driven by the shared restack animation group)
+        self.__pos_animation = QPropertyAnimation(self, b"pos")
+
+        # Timer for hiding the notification after set duration
+        self.__duration_timer = QTimer(self)
+        self.__duration_timer.setSingleShot(True)
+        self.__duration_timer.timeout.connect(self.hide)
+
+        # Apply stylesheet
+        self.setStyleSheet(Utils.get_stylesheet('toast'))
+
+    def __init_attributes(self):
+        """Initialize all attributes of the toast with their defaults"""
+
         self.__duration = 5000
         self.__show_duration_bar = True
         self.__title = ''
         self.__text = ''
         self.__icon = IconUtils.get_icon_from_enum(ToastIcon.INFORMATION)
         self.__show_icon = False
-        self.__icon_size = QSize(18, 18)
+        self.__icon_size = DEFAULT_ICON_SIZE
         self.__show_icon_separator = True
         self.__icon_separator_width = 2
         self.__close_button_icon = IconUtils.get_icon_from_enum(ToastIcon.CLOSE)
         self.__show_close_button = True
-        self.__close_button_icon_size = QSize(10, 10)
+        self.__close_button_icon_size = DEFAULT_CLOSE_BUTTON_ICON_SIZE
         self.__close_button_size = QSize(24, 24)
         self.__close_button_alignment = ToastButtonAlignment.TOP
         self.__fade_in_duration = 250
@@ -74,49 +164,70 @@ class Toast(QDialog):
         self.__text_section_margins = QMargins(0, 0, 15, 0)
         self.__close_button_margins = QMargins(0, -8, 0, -8)
         self.__text_section_spacing = 8
+        self.__render_mode = ToastRenderMode.WIDGETS
 
-        self.__elapsed_time = 0
+        self.__layout = None
+        self.__duration_bar_chunk_width = 0
+        self.__elapsed_timer = QElapsedTimer()
         self.__fading_out = False
+        self.__fade_backend_in_use = None
+        self.__opacity_effect = None
+        self.__fade_animation = None
         self.__used = False
-        self.__watched_widgets = []
 
-        # Window settings
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        # Toast widget (QLabel because QWidget has weird behaviour with stylesheets)
-        self.__toast_widget = QLabel(self)
+    def __apply_attributes(self):
+        """Apply the attributes of the toast to its widgets"""
 
-        # Drop shadow
-        self.__drop_shadow = DropShadow(self)
+        # Setting the icon sizes also sets and recolors the icons,
+        # so they are only recolored once at their actual size
+        self.setIconSize(self.__icon_size)
+        self.setIconSeparatorWidth(self.__icon_separator_width)
+        self.setCloseButtonIconSize(self.__close_button_icon_size)
+        self.setCloseButtonSize(self.__close_button_size)
+        self.setCloseButtonAlignment(self.__close_button_alignment)
+        self.setStayOnTop(self.__stay_on_top)
+        self.setBackgroundColor(self.__background_color)
+        self.setTitleColor(self.__title_color)
+        self.setTextColor(self.__text_color)
+        self.setBorderRadius(self.__border_radius)
+        self.setIconSeparatorColor(self.__icon_separator_color)
+        self.setDurationBarColor(self.__duration_bar_color)
+        self.setTitleFont(self.__title_font)
+        self.setTextFont(self.__text_font)
 
-        # Opacity effect for fading animations
-        self.__opacity_effect = QGraphicsOpacityEffect()
-        self.__opacity_effect.setOpacity(1)
-        self.setGraphicsEffect(self.__opacity_effect)
+    def __create_content_widgets(self):
+        """Create the widgets that show the title, text, icon, icon separator, and duration bar
+        and apply the attributes of the toast to them (not needed in single paint mode)"""
 
-        # Close button
-        self.__close_button = QPushButton(self.__toast_widget)
-        self.__close_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.__close_button.clicked.connect(self.hide)
-        self.__close_button.setObjectName('toast-close-button')
+        if self.__title_label is not None:
+            return
 
         # Title label
         self.__title_label = QLabel(self.__toast_widget)
+        self.__title_label.setText(self.__title)
+        self.__title_label.setFont(self.__title_font)
+        self.__title_label.setAlignment(TITLE_ALIGNMENT)
 
         # Text label
         self.__text_label = QLabel(self.__toast_widget)
+        self.__text_label.setText(self.__text)
+        self.__text_label.setFont(self.__text_font)
+        self.__text_label.setAlignment(TEXT_ALIGNMENT)
 
         # Icon (QPushButton instead of QLabel to get better icon quality)
         self.__icon_widget = QPushButton(self.__toast_widget)
         self.__icon_widget.setObjectName('toast-icon-widget')
+        self.__icon_widget.setFixedSize(self.__icon_size)
+        self.__icon_widget.setIconSize(self.__icon_size)
+        self.__update_icon_widget()
 
         # Icon separator
         self.__icon_separator = QWidget(self.__toast_widget)
+        self.__icon_separator.setFixedWidth(self.__icon_separator_width if self.__show_icon_separator else 0)
 
         # Duration bar container (used to make border radius possible on 4 px high widget)
         self.__duration_bar_container = QWidget(self.__toast_widget)
-        self.__duration_bar_container.setFixedHeight(4)
+        self.__duration_bar_container.setFixedHeight(DURATION_BAR_HEIGHT)
         self.__duration_bar_container.setStyleSheet('background: transparent;')
 
         # Duration bar
@@ -129,56 +240,27 @@ class Toast(QDialog):
         self.__duration_bar_chunk.setFixedHeight(20)
         self.__duration_bar_chunk.move(0, -16)
 
-        # Set defaults
-        self.setIcon(self.__icon)
-        self.setIconSize(self.__icon_size)
-        self.setIconColor(self.__icon_color)
-        self.setIconSeparatorWidth(self.__icon_separator_width)
-        self.setCloseButtonIcon(self.__close_button_icon)
-        self.setCloseButtonIconSize(self.__close_button_icon_size)
-        self.setCloseButtonSize(self.__close_button_size)
-        self.setCloseButtonAlignment(self.__close_button_alignment)
-        self.setStayOnTop(self.__stay_on_top)
-        self.setBackgroundColor(self.__background_color)
-        self.setTitleColor(self.__title_color)
-        self.setTextColor(self.__text_color)
-        self.setBorderRadius(self.__border_radius)
-        self.setIconSeparatorColor(self.__icon_separator_color)
-        self.setCloseButtonIconColor(self.__close_button_icon_color)
-        self.setDurationBarColor(self.__duration_bar_color)
-        self.setTitleFont(self.__title_font)
-        self.setTextFont(self.__text_font)
-
-        # Timer for hiding the notification after set duration
-        self.__duration_timer = QTimer(self)
-        self.__duration_timer.setSingleShot(True)
-        self.__duration_timer.timeout.connect(self.hide)
+        # Children created after the toast was shown or made visible are hidden by default
+        for widget in self.__get_content_widgets():
+            widget.setVisible(True)
 
-        # Timer for updating the duration bar
-        self.__duration_bar_timer = QTimer(self)
-        self.__duration_bar_timer.timeout.connect(self.__update_duration_bar)
+    def __get_content_widgets(self) -> list[QWidget]:
+        """Get the widgets that show the title, text, icon, icon separator, and duration bar
 
-        # Apply stylesheet
-        self.setStyleSheet(open(Utils.get_current_directory() + '/css/toast.css').read())
-
-        # Install event filters if position relative to widget and moving with widget
-        if Toast.__position_relative_to_widget and Toast.__move_position_with_widget:
-            self.__install_widget_event_filter()
-            self.__install_watched_widgets_event_filters()
+        :return: content widgets (empty if they were not created)
+        """
 
-    def eventFilter(self, watched, event):
-        # If moved or resized, update toast position if shown
-        if Toast.__position_relative_to_widget and Toast.__move_position_with_widget:
-            if event.type() == event.Type.Move or event.type() == event.Type.Resize:
-                if watched == Toast.__position_relative_to_widget or watched in self.__watched_widgets:
-                    if self in Toast.__currently_shown:
-                        self.__update_position_xy(animate=False)
+        if self.__title_label is None:
+            return []
+        return [self.__icon_widget, self.__icon_separator, self.__title_label,
+                self.__text_label, self.__duration_bar_container]
 
-        # One of the parents changed or deleted
-        if event.type() == event.Type.ParentChange or event.type() == event.Type.DeferredDelete:
-            self.__install_watched_widgets_event_filters()
+    def __update_icon_widget(self):
+        """Show the recolored icon on the icon widget (if it was created)"""
 
-        return False
+        if self.__icon_widget is not None:
+            self.__icon_widget.setIcon(QIcon(IconUtils.get_recolored_pixmap(
+                self.__icon, self.__icon_size, self.__icon_color)))
 
     def enterEvent(self, event):
         """Event that happens every time the mouse enters this widget.
@@ -193,9 +275,8 @@ class Toast(QDialog):
 
             # Reset duration bar if enabled
             if self.__show_duration_bar:
-                self.__duration_bar_timer.stop()
-                self.__duration_bar_chunk.setFixedWidth(self.width())
-                self.__elapsed_time = 0
+                self.__stop_duration_bar()
+                self.__set_duration_bar_chunk_width(self.__layout.duration_bar.width)
 
     def leaveEvent(self, event):
         """Event that happens every time the mouse leaves this widget.
@@ -210,7 +291,68 @@ class Toast(QDialog):
 
             # Restart duration bar animation if enabled
             if self.__show_duration_bar:
-                self.__duration_bar_timer.start(DURATION_BAR_UPDATE_INTERVAL)
+                self.__start_duration_bar()
+
+    def paintEvent(self, event):
+        """Event that happens every time the toast is painted.
+        In single paint mode, the whole toast except the close button is drawn here
+
+        :param event: the event sent by PyQt
+        """
+
+        if self.__render_mode != ToastRenderMode.SINGLE_PAINT or self.__layout is None:
+            super().paintEvent(event)
+            return
+
+        layout = self.__layout
+        painter = QPainter(self)
+
+        # Drop shadow
+        painter.drawPixmap(0, 0, DropShadow.get_pixmap(self.size(), self.devicePixelRatioF()))
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        # Background (also used as clip path so the duration bar gets rounded corners)
+        painter.translate(DROP_SHADOW_SIZE, DROP_SHADOW_SIZE)
+        background_path = QPainterPath()
+        background_path.addRoundedRect(QRectF(0, 0, layout.width, layout.height),
+                                       self.__border_radius, self.__border_radius)
+        painter.fillPath(background_path, self.__background_color)
+
+        # Icon and icon separator
+        if self.__show_icon:
+            icon_pixmap = IconUtils.get_recolored_pixmap(self.__icon, self.__icon_size, self.__icon_color)
+            painter.drawPixmap(QRect(*layout.icon), icon_pixmap)
+            painter.fillRect(QRect(*layout.icon_separator), self.__icon_separator_color)
+
+        # Title and text (aligned like the labels in widget mode)
+        title_flags = int(TITLE_ALIGNMENT)
+        text_flags = int(TEXT_ALIGNMENT)
+        if layout.word_wrap:
+            title_flags |= int(Qt.TextFlag.TextWordWrap)
+            text_flags |= int(Qt.TextFlag.TextWordWrap)
+
+        painter.setFont(self.__title_font)
+        painter.setPen(self.__title_color)
+        painter.drawText(QRect(*layout.title), title_flags, self.__title)
+        painter.setFont(self.__text_font)
+        painter.setPen(self.__text_color)
+        painter.drawText(QRect(*layout.text), text_flags, self.__text)
+
+        # Duration bar
+        if self.__show_duration_bar:
+            painter.setClipPath(background_path)
+            bar_rect = QRect(*layout.duration_bar)
+            painter.fillRect(bar_rect, QColor(self.__duration_bar_color.red(),
+                                              self.__duration_bar_color.green(),
+                                              self.__duration_bar_color.blue(), 100))
+            painter.fillRect(QRect(bar_rect.x(), bar_rect.y(), self.__duration_bar_chunk_width,
+                                   bar_rect.height()), QColor(self.__duration_bar_color.red(),
+                                                              self.__duration_bar_color.green(),
+                                                              self.__duration_bar_color.blue()))
+
+        painter.end()
 
     def show(self):
         """Show the toast notification"""
@@ -221,64 +363,77 @@ class Toast(QDialog):
 
         # If max notifications on screen not reached, show notification
         if Toast.__maximum_on_screen > len(Toast.__currently_shown):
-            self.__used = True
-            Toast.__currently_shown.append(self)
+            self.__admit()
+            Toast.__enter([self])
+        else:
+            # Add notification to queue instead
+            Toast.__enqueue(self)
 
-            # Setup UI
-            self.__setup_ui()
+    def __admit(self):
+        """Add the toast to the currently shown toasts and prepare it for showing"""
 
-            # Start duration timer
-            if self.__duration != 0:
-                self.__duration_timer.start(self.__duration)
+        self.__used = True
+        Toast.__currently_shown[self] = None
+
+        # Setup UI
+        self.__setup_ui()
 
-            # Start duration bar update timer
-            if self.__duration != 0 and self.__show_duration_bar:
-                self.__duration_bar_timer.start(DURATION_BAR_UPDATE_INTERVAL)
+        # Start duration timer
+        if self.__duration != 0:
+            self.__duration_timer.start(self.__duration)
+
+        # Start duration bar update timer
+        if self.__duration != 0 and self.__show_duration_bar:
+            self.__start_duration_bar()
 
-            # Calculate position and show (animate position too if not first notification)
-            x, y = self.__calculate_position()
+    @staticmethod
+    def __enter(entering_toasts: list[Toast]):
+        """Move admitted toasts to their start positions, fade them in,
+        and restack every currently shown toast once
+
+        :param entering_toasts: admitted toasts (in the order they were admitted)
+        """
+
+        # Calculate positions of all toasts once (shared with the restack)
+        positions = Toast.__calculate_positions()
+
+        # Admitted toasts are always the newest shown toasts,
+        # so only the toast shown before them has to be looked up
+        first_index = len(positions) - len(entering_toasts)
+        predecessor_toast = next(islice(reversed(Toast.__currently_shown), len(entering_toasts), None), None)
+
+        for i, toast in enumerate(entering_toasts, first_index):
+            x, y = positions[i]
 
             # If not first toast on screen, also do a fade down/up animation
-            if len(Toast.__currently_shown) > 1:
+            if predecessor_toast is not None:
                 # Calculate offset if predecessor toast is still in fade down / up animation
-                predecessor_toast = Toast.__currently_shown[Toast.__currently_shown.index(self) - 1]
-                predecessor_target_x, predecessor_target_y = predecessor_toast.__calculate_position()
+                predecessor_target_x, predecessor_target_y = positions[i - 1]
                 predecessor_target_difference_y = abs(predecessor_toast.y() - predecessor_target_y)
 
                 # Calculate start position of fade down / up animation based on position
                 if (Toast.__position == ToastPosition.BOTTOM_RIGHT
                         or Toast.__position == ToastPosition.BOTTOM_LEFT
                         or Toast.__position == ToastPosition.BOTTOM_MIDDLE):
-                    self.move(x, y - int(self.height() / 1.5) - predecessor_target_difference_y)
+                    toast.move(x, y - int(toast.height() / 1.5) - predecessor_target_difference_y)
 
                 elif (Toast.__position == ToastPosition.TOP_RIGHT
                       or Toast.__position == ToastPosition.TOP_LEFT
                       or Toast.__position == ToastPosition.TOP_MIDDLE
                       or Toast.__position == ToastPosition.CENTER):
-                    self.move(x, y + int(self.height() / 1.5) + predecessor_target_difference_y)
+                    toast.move(x, y + int(toast.height() / 1.5) + predecessor_target_difference_y)
 
-                # Start fade down / up animation
-                self.__pos_animation = QPropertyAnimation(self, b"pos")
-                self.__pos_animation.setEndValue(QPoint(x, y))
-                self.__pos_animation.setDuration(self.__fade_in_duration)
-                self.__pos_animation.start()
             else:
-                self.move(x, y)
+                toast.move(x, y)
 
             # Fade in
-            super().show()
-            self.__fade_in_animation = QPropertyAnimation(self.__opacity_effect, b"opacity")
-            self.__fade_in_animation.setDuration(self.__fade_in_duration)
-            self.__fade_in_animation.setStartValue(0)
-            self.__fade_in_animation.setEndValue(1)
-            self.__fade_in_animation.start()
+            toast.__setup_fade_backend()
+            super(Toast, toast).show()
+            toast.__start_fade(0, 1, toast.__fade_in_duration)
+            predecessor_toast = toast
 
-            # Update every other currently shown notification
-            for toast in Toast.__currently_shown:
-                toast.__update_position_xy()
-        else:
-            # Add notification to queue instead
-            Toast.__queue.append(self)
+        # Update every currently shown notification (including the fade down / up animations)
+        Toast.__restack(entering_toasts=entering_toasts, positions=positions)
 
     def hide(self):
         """Start hiding process of the toast notification"""
@@ -292,12 +447,52 @@ class Toast(QDialog):
     def __fade_out(self):
         """Start the fade out animation"""
 
-        self.__fade_out_animation = QPropertyAnimation(self.__opacity_effect, b"opacity")
-        self.__fade_out_animation.setDuration(self.__fade_out_duration)
-        self.__fade_out_animation.setStartValue(1)
-        self.__fade_out_animation.setEndValue(0)
-        self.__fade_out_animation.finished.connect(self.__hide)
-        self.__fade_out_animation.start()
+        if not self.__start_fade(1, 0, self.__fade_out_duration):
+            self.__hide()
+
+    def __setup_fade_backend(self):
+        """Set up the fade backend that is active when the toast is shown"""
+
+        self.__fade_backend_in_use = Toast.getActiveFadeBackend()
+
+        if self.__fade_backend_in_use == ToastFadeBackend.GRAPHICS_EFFECT:
+            # Opacity effect is only created when needed since it renders the toast offscreen
+            self.__opacity_effect = QGraphicsOpacityEffect()
+            self.__opacity_effect.setOpacity(1)
+            self.setGraphicsEffect(self.__opacity_effect)
+            self.__fade_animation = QPropertyAnimation(self.__opacity_effect, b"opacity")
+
+        elif self.__fade_backend_in_use == ToastFadeBackend.WINDOW_OPACITY:
+            self.setWindowOpacity(0)
+            self.__fade_animation = QPropertyAnimation(self, b"windowOpacity")
+
+        if self.__fade_animation is not None:
+            self.__fade_animation.finished.connect(self.__fade_finished)
+
+    def __start_fade(self, start_value: float, end_value: float, duration: int) -> bool:
+        """Retarget and start the fade animation of the toast
+
+        :param start_value: start opacity
+        :param end_value: end opacity
+        :param duration: duration of the animation in milliseconds
+        :return: whether the animation was started (False if fading is disabled)
+        """
+
+        if self.__fade_animation is None:
+            return False
+
+        self.__fade_animation.stop()
+        self.__fade_animation.setDuration(duration)
+        self.__fade_animation.setStartValue(start_value)
+        self.__fade_animation.setEndValue(end_value)
+        self.__fade_animation.start()
+        return True
+
+    def __fade_finished(self):
+        """Hide the toast once the fade out animation has finished"""
+
+        if self.__fading_out:
+            self.__hide()
 
     def __hide(self):
         """Hide the toast notification"""
@@ -305,85 +500,220 @@ class Toast(QDialog):
         self.close()
 
         if self in Toast.__currently_shown:
-            Toast.__currently_shown.remove(self)
-            self.__elapsed_time = 0
+            del Toast.__currently_shown[self]
+            self.__stop_duration_bar()
             self.__fading_out = False
 
             # Emit signal
             self.closed.emit()
 
             # Update every other currently shown notification
-            for toast in Toast.__currently_shown:
-                toast.__update_position_y()
+            Toast.__update_currently_showing_position_y()
 
             # Show next item from queue after updating
-            timer = QTimer(self)
-            timer.setSingleShot(True)
-            timer.timeout.connect(Toast.__show_next_in_queue)
-            timer.start(self.__fade_in_duration)
+            QTimer.singleShot(self.__fade_in_duration, Toast.__show_next_in_queue)
+
+            # Return toast to the pool if it was obtained from it
+            if self.__pooled:
+                Toast.__release(self)
+
+    def __start_duration_bar(self):
+        """Start measuring the elapsed time and updating the duration bar"""
+
+        self.__elapsed_timer.start()
+        Toast.__animated_duration_bars[self] = None
+
+        # Start shared ticker if it is not already running
+        if Toast.__duration_bar_ticker is None:
+            Toast.__duration_bar_ticker = QTimer()
+            Toast.__duration_bar_ticker.timeout.connect(Toast.__update_duration_bars)
+
+        if not Toast.__duration_bar_ticker.isActive():
+            Toast.__duration_bar_ticker.start(Toast.__get_frame_interval())
+
+    def __stop_duration_bar(self):
+        """Stop updating the duration bar (stops the shared ticker if it was the last one)"""
+
+        Toast.__animated_duration_bars.pop(self, None)
+
+        if len(Toast.__animated_duration_bars) == 0 and Toast.__duration_bar_ticker is not None:
+            Toast.__duration_bar_ticker.stop()
+
+    @staticmethod
+    def __update_duration_bars():
+        """Update the duration bars of all animated toasts in one pass"""
+
+        for toast in list(Toast.__animated_duration_bars):
+            toast.__update_duration_bar()
 
     def __update_duration_bar(self):
         """Update the duration bar chunk with the elapsed time"""
 
-        self.__elapsed_time += DURATION_BAR_UPDATE_INTERVAL
+        elapsed_time = self.__elapsed_timer.elapsed()
 
-        if self.__elapsed_time >= self.__duration:
-            self.__duration_bar_timer.stop()
+        if elapsed_time >= self.__duration:
+            self.__stop_duration_bar()
             return
 
-        new_chunk_width = math.floor(self.__duration_bar_container.width()
-                                     - self.__elapsed_time / self.__duration
-                                     * self.__duration_bar_container.width())
-        self.__duration_bar_chunk.setFixedWidth(new_chunk_width)
+        # Use the calculated layout since the widgets are not resized in single paint mode
+        bar_width = self.__layout.duration_bar.width
+        new_chunk_width = math.floor(bar_width - elapsed_time / self.__duration * bar_width)
 
-    def __update_position_xy(self, animate: bool = True):
-        """Update the x and y position of the toast with an optional animation
+        self.__set_duration_bar_chunk_width(new_chunk_width)
 
-        :param animate: whether the position change should be animated
-        """
+    def __set_duration_bar_chunk_width(self, width: int):
+        """Set the width of the duration bar chunk (only updates if the width changed)
 
-        x, y = self.__calculate_position()
-        position = QPoint(x, y)
+        :param width: new width of the chunk
+        """
 
-        # Animate position change
-        self.__pos_animation = QPropertyAnimation(self, b"pos")
-        self.__pos_animation.setEndValue(position)
-        self.__pos_animation.setDuration(UPDATE_POSITION_DURATION if animate else 0)
-        self.__pos_animation.start()
+        if width == self.__duration_bar_chunk_width:
+            return
+        self.__duration_bar_chunk_width = width
+
+        if self.__render_mode == ToastRenderMode.SINGLE_PAINT:
+            # Only repaint the duration bar area
+            if self.__layout is not None:
+                self.update(self.__layout.duration_bar.x + DROP_SHADOW_SIZE,
+                            self.__layout.duration_bar.y + DROP_SHADOW_SIZE,
+                            self.__layout.duration_bar.width,
+                            self.__layout.duration_bar.height)
+        elif self.__duration_bar_chunk is not None:
+            self.__duration_bar_chunk.setFixedWidth(width)
 
-    def __update_position_x(self, animate: bool = True):
-        """Update the x position of the toast with an optional animation
+    @staticmethod
+    def __get_frame_interval() -> int:
+        """Get the interval between two animation frames based on the frame rate
 
-        :param animate: whether the position change should be animated
+        :return: interval in milliseconds
         """
 
-        x, y = self.__calculate_position()
-        position = QPoint(x, self.y())
+        frame_rate = Toast.__frame_rate
 
-        # Animate position change
-        self.__pos_animation = QPropertyAnimation(self, b"pos")
-        self.__pos_animation.setEndValue(position)
-        self.__pos_animation.setDuration(UPDATE_POSITION_DURATION if animate else 0)
-        self.__pos_animation.start()
+        # Use refresh rate of the primary screen if no frame rate is set
+        if frame_rate <= 0:
+            primary_screen = QGuiApplication.primaryScreen()
+            if primary_screen is not None:
+                frame_rate = primary_screen.refreshRate()
+            if frame_rate <= 0:
+                frame_rate = DEFAULT_FRAME_RATE
 
-    def __update_position_y(self, animate: bool = True):
-        """Update the y position of the toast with an optional animation
+        return max(1, round(1000 / frame_rate))
 
-        :param animate: whether the position change should be animated
+    @staticmethod
+    def __get_bounds(parent: QWidget | None) -> QRect:
+        """Get the bounds (QRect) of the target screen or widget. The bounds are cached
+        until a screen or the watched widget changes its geometry
+
+        :param parent: parent of the toast
+        :return: rect of the target screen or widget
         """
 
-        x, y = self.__calculate_position()
-        position = QPoint(self.x(), y)
+        # Widget bounds can only be cached while the geometry of the widget is watched
+        if Toast.__position_relative_to_widget is not None and not (
+                Toast.__move_position_with_widget and Toast.__position_relative_to_widget.isVisible()):
+            return Toast.__calculate_bounds(parent)
 
-        # Animate position change
-        self.__pos_animation = QPropertyAnimation(self, b"pos")
-        self.__pos_animation.setEndValue(position)
-        self.__pos_animation.setDuration(UPDATE_POSITION_DURATION if animate else 0)
-        self.__pos_animation.start()
+        # Bounds only depend on the parent if the screen is chosen by the parent geometry
+        if (Toast.__position_relative_to_widget is None and Toast.__fixed_screen is None
+                and not Toast.__always_on_main_screen and parent is not None):
+            key = parent.geometry().getRect()
+        else:
+            key = None
+
+        Toast.__connect_screen_signals()
+
+        cache = Toast.__bounds_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        bounds = Toast.__calculate_bounds(parent)
+        cache[key] = bounds
+        while len(cache) > BOUNDS_CACHE_SIZE:
+            cache.popitem(last=False)
+        return bounds
+
+    @staticmethod
+    def __update_anchor_watcher():
+        """Watch the widget the position is relative to if the toasts should move with it"""
+
+        widget = None
+        if Toast.__position_relative_to_widget is not None and Toast.__move_position_with_widget:
+            widget = Toast.__position_relative_to_widget
+
+        if Toast.__anchor_watcher is None:
+            if widget is None:
+                return
+            Toast.__anchor_watcher = AnchorWatcher()
+            Toast.__anchor_watcher.changed.connect(Toast.__anchor_changed)
+
+        Toast.__anchor_watcher.set_widget(widget)
 
-    def __get_bounds(self) -> QRect:
-        """Get the bounds (QRect) of the target screen or widget
+    @staticmethod
+    def __anchor_changed():
+        """Update the position of all currently shown toasts after the watched widget changed
+        (deferred to the next frame if position updates are coalesced)"""
+
+        Toast.__invalidate_bounds()
+
+        if not Toast.__coalesce_widget_events:
+            Toast.__update_currently_showing_position_xy(animate=False)
+            return
+
+        if Toast.__coalesce_timer is None:
+            Toast.__coalesce_timer = QTimer()
+            Toast.__coalesce_timer.setSingleShot(True)
+            Toast.__coalesce_timer.timeout.connect(Toast.__apply_coalesced_position_update)
+
+        # Only the first change until the next frame starts the timer
+        if not Toast.__coalesce_timer.isActive():
+            Toast.__coalesce_timer.start(Toast.__get_frame_interval())
+
+    @staticmethod
+    def __apply_coalesced_position_update():
+        """Update the position of all currently shown toasts once for all coalesced changes"""
 
+        Toast.__update_currently_showing_position_xy(animate=False)
+
+    @staticmethod
+    def __invalidate_bounds(*args):
+        """Remove all cached bounds (connected to screen and geometry changes)"""
+
+        Toast.__bounds_cache.clear()
+
+    @staticmethod
+    def __connect_screen_signals():
+        """Invalidate the cached bounds whenever screens are added, removed, or changed"""
+
+        if Toast.__screen_signals_connected:
+            return
+
+        application = QGuiApplication.instance()
+        application.screenAdded.connect(Toast.__screen_added)
+        application.screenRemoved.connect(Toast.__invalidate_bounds)
+        application.primaryScreenChanged.connect(Toast.__invalidate_bounds)
+
+        for screen in QGuiApplication.screens():
+            screen.geometryChanged.connect(Toast.__invalidate_bounds)
+
+        Toast.__screen_signals_connected = True
+
+    @staticmethod
+    def __screen_added(screen: QScreen):
+        """Watch the geometry of a new screen and invalidate the cached bounds
+
+        :param screen: screen that was added
+        """
+
+        screen.geometryChanged.connect(Toast.__invalidate_bounds)
+        Toast.__invalidate_bounds()
+
+    @staticmethod
+    def __calculate_bounds(parent: QWidget | None) -> QRect:
+        """Calculate the bounds (QRect) of the target screen or widget
+
+        :param parent: parent of the toast
         :return: rect of the target screen or widget
         """
 
@@ -404,12 +734,12 @@ class Toast(QDialog):
             )
         elif Toast.__fixed_screen is not None:
             current_screen = Toast.__fixed_screen
-        elif Toast.__always_on_main_screen or self.parent() is None:
+        elif Toast.__always_on_main_screen or parent is None:
             current_screen = primary_screen
         else:
             screens = QGuiApplication.screens()
             for screen in screens:
-                if self.parent().geometry().intersects(screen.geometry()):
+                if parent.geometry().intersects(screen.geometry()):
                     if current_screen is None:
                         current_screen = screen
                     else:
@@ -418,425 +748,156 @@ class Toast(QDialog):
 
         return current_screen.geometry()
 
-    def __calculate_position(self):
-        """Calculate x and y position of the toast
+    @staticmethod
+    def __calculate_positions() -> list[tuple[int, int]]:
+        """Calculate x and y position of every currently shown toast in one pass
 
-        :return: x and y position
+        :return: x and y positions (in the order of the currently shown toasts)
         """
 
-        # Calculate vertical space taken up by all the currently showing notifications
-        y_offset = 0
+        # Look up the bounds only once per parent
+        bounds_by_parent = {}
+        bounds = []
         for toast in Toast.__currently_shown:
-            if toast == self:
-                break
-            y_offset += toast.__toast_widget.height() + Toast.__spacing
-
-        # Calculate x and y position of notification
-        x = 0
-        y = 0
-        bounds = self.__get_bounds()
-
-        if Toast.__position == ToastPosition.BOTTOM_RIGHT:
-            x = (bounds.width() - self.__toast_widget.width()
-                 - Toast.__offset_x + bounds.x())
-            y = (bounds.height() - self.__toast_widget.height()
-                 - Toast.__offset_y + bounds.y() - y_offset)
-
-        elif Toast.__position == ToastPosition.BOTTOM_LEFT:
-            x = bounds.x() + Toast.__offset_x
-            y = (bounds.height() - self.__toast_widget.height()
-                 - Toast.__offset_y + bounds.y() - y_offset)
-
-        elif Toast.__position == ToastPosition.BOTTOM_MIDDLE:
-            x = (bounds.x() + bounds.width() / 2 - self.__toast_widget.width() / 2)
-            y = (bounds.height() - self.__toast_widget.height()
-                 - Toast.__offset_y + bounds.y() - y_offset)
-
-        elif Toast.__position == ToastPosition.TOP_RIGHT:
-            x = (bounds.width() - self.__toast_widget.width()
-                 - Toast.__offset_x + bounds.x())
-            y = (bounds.y() + Toast.__offset_y + y_offset)
-
-        elif Toast.__position == ToastPosition.TOP_LEFT:
-            x = bounds.x() + Toast.__offset_x
-            y = (bounds.y() + Toast.__offset_y + y_offset)
-
-        elif Toast.__position == ToastPosition.TOP_MIDDLE:
-            x = (bounds.x() + bounds.width() / 2 - self.__toast_widget.width() / 2)
-            y = (bounds.y() + Toast.__offset_y + y_offset)
-
-        elif Toast.__position == ToastPosition.CENTER:
-            x = (bounds.x() + bounds.width() / 2 - self.__toast_widget.width() / 2)
-            if y_offset == 0:
-                y = (bounds.y() + bounds.height() / 2
-                     - self.__toast_widget.height() / 2 + y_offset)
-            else:
-                y_start = (bounds.y() + bounds.height() / 2
-                           - self.__currently_shown[0].__toast_widget.height() / 2)
-                y = y_start + y_offset
-
-        x = int(x - DROP_SHADOW_SIZE)
-        y = int(y - DROP_SHADOW_SIZE)
-
-        return x, y
+            parent = toast.parent()
+            if parent not in bounds_by_parent:
+                rect = Toast.__get_bounds(parent)
+                bounds_by_parent[parent] = LayoutRect(rect.x(), rect.y(), rect.width(), rect.height())
+            bounds.append(bounds_by_parent[parent])
+
+        return LayoutUtils.calculate_stack_positions(
+            Toast.__position,
+            [(toast.__toast_widget.width(), toast.__toast_widget.height())
+             for toast in Toast.__currently_shown],
+            bounds,
+            Toast.__spacing,
+            (Toast.__offset_x, Toast.__offset_y),
+            DROP_SHADOW_SIZE
+        )
 
     def __setup_ui(self):
         """Calculate best toast size and place and move everything correctly"""
 
+        # Only widget mode needs the content widgets
+        if self.__render_mode == ToastRenderMode.WIDGETS:
+            self.__create_content_widgets()
+
         # Update stylesheet
         self.__update_stylesheet()
 
-        # Calculate title and text width and height
-        title_font_metrics = QFontMetrics(self.__title_font)
-        title_width = title_font_metrics.width(self.__title_label.text())
-        title_height = title_font_metrics.boundingRect(self.__title_label.text()).height()
-        text_font_metrics = QFontMetrics(self.__text_font)
-        text_width = text_font_metrics.width(self.__text_label.text())
-        text_height = text_font_metrics.boundingRect(self.__text_label.text()).height()
-        text_section_spacing = self.__text_section_spacing
-        if self.__title == '' or self.__text == '':
-            text_section_spacing = 0
+        # Calculate layout and apply it to the widgets
+        self.__layout = LayoutUtils.calculate_toast_layout(
+            self.__get_layout_options(),
+            (TextUtils.get_text_width(self.__title_font, self.__title),
+             TextUtils.get_text_height(self.__title_font, self.__title)),
+            (TextUtils.get_text_width(self.__text_font, self.__text),
+             TextUtils.get_text_height(self.__text_font, self.__text)),
+            self.__measure_wrapped_text
+        )
+        self.__apply_layout(self.__layout)
 
-        text_section_height = (self.__text_section_margins.top()
-                               + title_height + text_section_spacing
-                               + text_height + self.__text_section_margins.bottom())
+    def __get_layout_options(self) -> ToastLayoutOptions:
+        """Get the options needed to calculate the layout of the toast
 
-        # Calculate duration bar height
-        duration_bar_height = 0 if not self.__show_duration_bar else self.__duration_bar_container.height()
+        :return: layout options
+        """
 
-        # Calculate icon section width and height
-        icon_section_width = 0
-        icon_section_height = 0
+        def to_layout_margins(margins: QMargins) -> LayoutMargins:
+            return LayoutMargins(margins.left(), margins.top(), margins.right(), margins.bottom())
 
-        if self.__show_icon:
-            icon_section_width = (self.__icon_section_margins.left()
-                                  + self.__icon_margins.left() + self.__icon_widget.width()
-                                  + self.__icon_margins.right() + self.__icon_separator.width()
-                                  + self.__icon_section_margins.right())
-            icon_section_height = (self.__icon_section_margins.top() + self.__icon_margins.top()
-                                   + self.__icon_widget.height() + self.__icon_margins.bottom()
-                                   + self.__icon_section_margins.bottom())
-
-        # Calculate close button section height
-        close_button_width = self.__close_button.width() if self.__show_close_button else 0
-        close_button_height = self.__close_button.height() if self.__show_close_button else 0
-        close_button_margins = self.__close_button_margins if self.__show_close_button else QMargins(0, 0, 0, 0)
-
-        close_button_section_height = (close_button_margins.top()
-                                       + close_button_height
-                                       + close_button_margins.bottom())
-
-        # Calculate needed width and height
-        width = (self.__margins.left() + icon_section_width + self.__text_section_margins.left()
-                 + max(title_width, text_width) + self.__text_section_margins.right()
-                 + close_button_margins.left() + close_button_width
-                 + close_button_margins.right() + self.__margins.right())
-
-        height = (self.__margins.top()
-                  + max(icon_section_height, text_section_height, close_button_section_height)
-                  + self.__margins.bottom() + duration_bar_height)
-
-        forced_additional_height = 0
-        forced_reduced_height = 0
-
-        # Handle width greater than maximum width
-        if width > self.maximumWidth():
-            # Enable line break for title and text and recalculate size
-            new_title_text_width = max(title_width, text_width) - (width - self.maximumWidth())
-            if new_title_text_width > 0:
-                title_width = new_title_text_width
-                text_width = new_title_text_width
-
-            self.__title_label.setMinimumWidth(title_width)
-            self.__title_label.setWordWrap(True)
-            if self.__title != '':
-                title_height = self.__title_label.sizeHint().height()
-            self.__title_label.setFixedSize(title_width, title_height)
+        return ToastLayoutOptions(
+            margins=to_layout_margins(self.__margins),
+            icon_margins=to_layout_margins(self.__icon_margins),
+            icon_section_margins=to_layout_margins(self.__icon_section_margins),
+            text_section_margins=to_layout_margins(self.__text_section_margins),
+            close_button_margins=to_layout_margins(self.__close_button_margins),
+            icon_size=(self.__icon_size.width(), self.__icon_size.height()),
+            icon_separator_width=self.__icon_separator_width if self.__show_icon_separator else 0,
+            close_button_size=(self.__close_button.width(), self.__close_button.height()),
+            close_button_alignment=self.__close_button_alignment,
+            text_section_spacing=self.__text_section_spacing,
+            duration_bar_height=DURATION_BAR_HEIGHT if self.__show_duration_bar else 0,
+            show_icon=self.__show_icon,
+            show_close_button=self.__show_close_button,
+            has_title=self.__title != '',
+            has_text=self.__text != '',
+            minimum_size=(self.minimumWidth(), self.minimumHeight()),
+            maximum_size=(self.maximumWidth(), self.maximumHeight())
+        )
 
-            self.__text_label.setMinimumWidth(text_width)
-            self.__text_label.setWordWrap(True)
-            if self.__text != '':
-                text_height = self.__text_label.sizeHint().height()
-            self.__text_label.setFixedSize(text_width, text_height)
+    def __measure_wrapped_text(self, width: int) -> tuple[int, int, int, int]:
+        """Measure the title and the text when word wrapped at a width
 
-            # Recalculate width and height
-            width = self.maximumWidth()
+        :param width: width at which the title and the text are wrapped
+        :return: title width, title height, text width, and text height
+        """
 
-            text_section_height = (self.__text_section_margins.top()
-                                   + title_height + text_section_spacing
-                                   + text_height + self.__text_section_margins.bottom())
+        title_width, title_height = TextUtils.get_wrapped_text_size(self.__title_font, self.__title, width)
+        text_width, text_height = TextUtils.get_wrapped_text_size(self.__text_font, self.__text, width)
+        return title_width, title_height, text_width, text_height
 
-            height = (self.__margins.top()
-                      + max(icon_section_height, text_section_height, close_button_section_height)
-                      + self.__margins.bottom() + duration_bar_height)
+    def __apply_layout(self, layout: ToastLayout):
+        """Resize and move all the widgets of the toast according to a layout
 
-        # Handle height less than minimum height
-        if height < self.minimumHeight():
-            # Enable word wrap for title and text labels
-            self.__title_label.setWordWrap(True)
-            self.__text_label.setWordWrap(True)
-
-            # Calculate height with initial label width
-            title_width = (self.__title_label.fontMetrics().boundingRect(
-                QRect(0, 0, 0, 0), Qt.TextFlag.TextWordWrap, self.__title_label.text()).width())
-            text_width = (self.__text_label.fontMetrics().boundingRect(
-                QRect(0, 0, 0, 0), Qt.TextFlag.TextWordWrap, self.__text_label.text()).width())
-            temp_width = max(title_width, text_width)
-
-            title_width = (self.__title_label.fontMetrics().boundingRect(
-                QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__title_label.text()).width())
-            if self.__title != '':
-                title_height = (self.__title_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__title_label.text()).height())
-
-            text_width = (self.__text_label.fontMetrics().boundingRect(
-                QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__text_label.text()).width())
-            if self.__text != '':
-                text_height = (self.__text_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__text_label.text()).height())
-
-            text_section_height = (self.__text_section_margins.top()
-                                   + title_height + text_section_spacing
-                                   + text_height + self.__text_section_margins.bottom())
-
-            height = (self.__margins.top()
-                      + max(icon_section_height, text_section_height, close_button_section_height)
-                      + self.__margins.bottom() + duration_bar_height)
-
-            while temp_width <= width:
-                # Recalculate height with different text widths to find optimal value
-                temp_title_width = (self.__title_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__title_label.text()).width())
-                temp_title_height = (self.__title_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__title_label.text()).height())
-                temp_text_width = (self.__text_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__text_label.text()).width())
-                temp_text_height = (self.__text_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__text_label.text()).height())
-
-                if self.__title == '':
-                    temp_title_height = 0
-
-                if self.__text == '':
-                    temp_text_height = 0
-
-                temp_text_section_height = (self.__text_section_margins.top()
-                                            + temp_title_height + text_section_spacing
-                                            + temp_text_height + self.__text_section_margins.bottom())
-
-                temp_height = (self.__margins.top()
-                               + max(icon_section_height, temp_text_section_height,
-                                     close_button_section_height)
-                               + self.__margins.bottom() + duration_bar_height)
-
-                # Store values if calculated height is greater than or equal to min height
-                if temp_height >= self.minimumHeight():
-                    title_width = temp_title_width
-                    title_height = temp_title_height
-                    text_width = temp_text_width
-                    text_height = temp_text_height
-                    text_section_height = temp_text_section_height
-                    height = temp_height
-                    temp_width += 1
-
-                # Exit loop if calculated height is less than min height
-                else:
-                    break
-
-            # Recalculate width
-            width = (self.__margins.left() + icon_section_width + self.__text_section_margins.left()
-                     + max(title_width, text_width) + self.__text_section_margins.right()
-                     + close_button_margins.left() + close_button_width
-                     + close_button_margins.right() + self.__margins.right())
-
-            # If min height not met, set height to min height
-            if height < self.minimumHeight():
-                forced_additional_height = self.minimumHeight() - height
-                height = self.minimumHeight()
-
-        # Handle width less than minimum width
-        if width < self.minimumWidth():
-            width = self.minimumWidth()
-
-        # Handle height greater than maximum height
-        if height > self.maximumHeight():
-            forced_reduced_height = height - self.maximumHeight()
-            height = self.maximumHeight()
+        :param layout: calculated layout of the toast
+        """
 
         # Calculate width and height including space for drop shadow
-        total_width = width + (DROP_SHADOW_SIZE * 2)
-        total_height = height + (DROP_SHADOW_SIZE * 2)
+        total_width = layout.width + (DROP_SHADOW_SIZE * 2)
+        total_height = layout.height + (DROP_SHADOW_SIZE * 2)
 
         # Resize drop shadow
         self.__drop_shadow.resize(QSize(total_width, total_height))
 
         # Resize window
         super().setFixedSize(total_width, total_height)
-        self.__toast_widget.setFixedSize(width, height)
+        self.__toast_widget.setFixedSize(layout.width, layout.height)
         self.__toast_widget.move(DROP_SHADOW_SIZE, DROP_SHADOW_SIZE)
         self.__toast_widget.raise_()
+        self.__duration_bar_chunk_width = layout.duration_bar.width
 
-        # Calculate max height of all sections
-        max_section_height = max(icon_section_height, text_section_height, close_button_section_height)
+        # Move close button or hide it if disabled
+        self.__close_button.move(layout.close_button.x, layout.close_button.y)
+        if not self.__show_close_button:
+            self.__close_button.setVisible(False)
 
-        # Calculate difference between height and height of icon section and text section
-        height_icon_section_height_difference = max_section_height - icon_section_height
-        height_text_section_height_difference = max_section_height - text_section_height
+        # Everything except the close button is drawn in paintEvent in single paint mode
+        if self.__render_mode == ToastRenderMode.SINGLE_PAINT:
+            self.__drop_shadow.setVisible(False)
+            for widget in self.__get_content_widgets():
+                widget.setVisible(False)
+            return
 
         if self.__show_icon:
-            # Move icon
-            self.__icon_widget.move(self.__margins.left()
-                                    + self.__icon_section_margins.left()
-                                    + self.__icon_margins.left(),
-                                    self.__margins.top()
-                                    + self.__icon_section_margins.top()
-                                    + self.__icon_margins.top()
-                                    + math.ceil(height_icon_section_height_difference / 2)
-                                    + math.ceil(forced_additional_height / 2)
-                                    - math.floor(forced_reduced_height / 2))
-
-            # Move and resize icon separator
-            self.__icon_separator.setFixedHeight(text_section_height)
-            self.__icon_separator.move(self.__margins.left()
-                                       + self.__icon_section_margins.left()
-                                       + self.__icon_margins.left()
-                                       + self.__icon_widget.width()
-                                       + self.__icon_margins.right(),
-                                       self.__margins.top()
-                                       + self.__icon_section_margins.top()
-                                       + math.ceil(height_text_section_height_difference / 2)
-                                       + math.ceil(forced_additional_height / 2)
-                                       - math.floor(forced_reduced_height / 2))
+            # Move icon, move and resize icon separator
+            self.__icon_widget.move(layout.icon.x, layout.icon.y)
+            self.__icon_separator.setFixedHeight(layout.icon_separator.height)
+            self.__icon_separator.move(layout.icon_separator.x, layout.icon_separator.y)
         else:
             # Hide icon section
             self.__icon_widget.setVisible(False)
             self.__icon_separator.setVisible(False)
 
-        # Resize title and text labels
-        self.__title_label.setFixedSize(max(title_width, text_width), title_height)
-        self.__text_label.setFixedSize(max(title_width, text_width), text_height)
+        # Resize and move title and text labels
+        if layout.word_wrap:
+            self.__title_label.setWordWrap(True)
+            self.__text_label.setWordWrap(True)
 
-        # Move title and text labels
-        if self.__show_icon:
-            self.__title_label.move(self.__margins.left()
-                                    + self.__icon_section_margins.left()
-                                    + self.__icon_margins.left()
-                                    + self.__icon_widget.width()
-                                    + self.__icon_margins.right()
-                                    + self.__icon_separator.width()
-                                    + self.__icon_section_margins.right()
-                                    + self.__text_section_margins.left(),
-                                    self.__margins.top()
-                                    + self.__text_section_margins.top()
-                                    + math.ceil(height_text_section_height_difference / 2)
-                                    + math.ceil(forced_additional_height / 2)
-                                    - math.floor(forced_reduced_height / 2))
-
-            self.__text_label.move(self.__margins.left()
-                                   + self.__icon_section_margins.left()
-                                   + self.__icon_margins.left()
-                                   + self.__icon_widget.width()
-                                   + self.__icon_margins.right()
-                                   + self.__icon_separator.width()
-                                   + self.__icon_section_margins.right()
-                                   + self.__text_section_margins.left(),
-                                   self.__margins.top()
-                                   + self.__text_section_margins.top()
-                                   + title_height + self.__text_section_spacing
-                                   + math.ceil(height_text_section_height_difference / 2)
-                                   + math.ceil(forced_additional_height / 2)
-                                   - math.floor(forced_reduced_height / 2))
-
-        # Position is different if icon hidden
-        else:
-            self.__title_label.move(self.__margins.left()
-                                    + self.__text_section_margins.left(),
-                                    self.__margins.top()
-                                    + self.__text_section_margins.top()
-                                    + math.ceil(height_text_section_height_difference / 2)
-                                    + math.ceil(forced_additional_height / 2)
-                                    - math.floor(forced_reduced_height / 2))
-
-            self.__text_label.move(self.__margins.left()
-                                   + self.__text_section_margins.left(),
-                                   self.__margins.top()
-                                   + self.__text_section_margins.top()
-                                   + title_height + self.__text_section_spacing
-                                   + math.ceil(height_text_section_height_difference / 2)
-                                   + math.ceil(forced_additional_height / 2)
-                                   - math.floor(forced_reduced_height / 2))
-
-        # Adjust label position if either title or text is empty
-        if self.__title == '' and self.__text != '':
-            self.__text_label.move(self.__text_label.x(),
-                                   int((height - text_height - duration_bar_height) / 2))
-
-        elif self.__title != '' and self.__text == '':
-            self.__title_label.move(self.__title_label.x(),
-                                    int((height - title_height - duration_bar_height) / 2))
-
-        # Move close button to top, middle, or bottom position
-        if self.__close_button_alignment == ToastButtonAlignment.TOP:
-            self.__close_button.move(width - close_button_width
-                                     - close_button_margins.right() - self.__margins.right(),
-                                     self.__margins.top() + close_button_margins.top())
-        elif self.__close_button_alignment == ToastButtonAlignment.MIDDLE:
-            self.__close_button.move(width - close_button_width
-                                     - close_button_margins.right() - self.__margins.right(),
-                                     math.ceil((height - close_button_height
-                                               - duration_bar_height) / 2))
-        elif self.__close_button_alignment == ToastButtonAlignment.BOTTOM:
-            self.__close_button.move(width - close_button_width
-                                     - close_button_margins.right() - self.__margins.right(),
-                                     height - close_button_height
-                                     - self.__margins.bottom()
-                                     - close_button_margins.bottom() - duration_bar_height)
-
-        # Hide close button if disabled
-        if not self.__show_close_button:
-            self.__close_button.setVisible(False)
+        self.__title_label.setFixedSize(layout.title.width, layout.title.height)
+        self.__title_label.move(layout.title.x, layout.title.y)
+        self.__text_label.setFixedSize(layout.text.width, layout.text.height)
+        self.__text_label.move(layout.text.x, layout.text.y)
 
         # Resize, move, and show duration bar if enabled
         if self.__show_duration_bar:
-            self.__duration_bar_container.setFixedWidth(width)
-            self.__duration_bar_container.move(0, height - duration_bar_height)
-            self.__duration_bar.setFixedWidth(width)
-            self.__duration_bar_chunk.setFixedWidth(width)
+            self.__duration_bar_container.setFixedWidth(layout.duration_bar.width)
+            self.__duration_bar_container.move(layout.duration_bar.x, layout.duration_bar.y)
+            self.__duration_bar.setFixedWidth(layout.duration_bar.width)
+            self.__duration_bar_chunk.setFixedWidth(layout.duration_bar.width)
             self.__duration_bar_container.setVisible(True)
         else:
             self.__duration_bar_container.setVisible(False)
 
-    def __install_widget_event_filter(self):
-        """Install an event filter on parent"""
-
-        if Toast.__position_relative_to_widget:
-            Toast.__position_relative_to_widget.installEventFilter(self)
-
-    def __remove_widget_event_filter(self):
-        """Remove an installed event filter on parent"""
-
-        if Toast.__position_relative_to_widget:
-            Toast.__position_relative_to_widget.removeEventFilter(self)
-
-    def __remove_watched_widgets_event_filters(self):
-        """Remove installed event filters on watched widgets"""
-
-        for widget in self.__watched_widgets:
-            widget.removeEventFilter(self)
-        self.__watched_widgets.clear()
-
-    def __install_watched_widgets_event_filters(self):
-        """Install / reinstall event filters on watched widgets"""
-
-        self.__remove_watched_widgets_event_filters()
-
-        if Toast.__position_relative_to_widget is None:
-            return
-
-        self.__watched_widgets += Utils.get_parents(Toast.__position_relative_to_widget)
-        for widget in self.__watched_widgets:
-            widget.installEventFilter(self)
-
     def setFixedSize(self, size: QSize):
         """Set a fixed toast size
 
@@ -917,7 +978,8 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__title = title
-        self.__title_label.setText(title)
+        if self.__title_label is not None:
+            self.__title_label.setText(title)
 
     def getText(self) -> str:
         """Get the text of the toast
@@ -936,7 +998,8 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__text = text
-        self.__text_label.setText(text)
+        if self.__text_label is not None:
+            self.__text_label.setText(text)
 
     def getIcon(self) -> QPixmap:
         """Get the icon of the toast
@@ -946,22 +1009,23 @@ class Toast(QDialog):
 
         return self.__icon
 
-    def setIcon(self, icon: QPixmap | ToastIcon):
+    def setIcon(self, icon: QPixmap | ToastIcon | str):
         """Set the icon of the toast
 
-        :param icon: new icon
+        :param icon: new icon (pixmap, ToastIcon, name of a registered icon, or path)
         """
 
         if self.__used:
             return
 
-        if type(icon) == ToastIcon:
-            self.__icon = IconUtils.get_icon_from_enum(icon)
+        if type(icon) == ToastIcon or (type(icon) == str and IconUtils.is_icon_registered(icon)):
+            self.__icon = IconUtils.get_icon(icon)
+        elif type(icon) == str:
+            self.__icon = QPixmap(icon)
         else:
             self.__icon = icon
 
-        self.__icon_widget.setIcon(QIcon(self.__icon))
-        self.setIconColor(self.__icon_color)
+        self.__update_icon_widget()
 
     def isShowIcon(self) -> bool:
         """Get whether the icon is enabled
@@ -998,9 +1062,10 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__icon_size = size
-        self.__icon_widget.setFixedSize(size)
-        self.__icon_widget.setIconSize(size)
-        self.setIcon(self.__icon)
+        if self.__icon_widget is not None:
+            self.__icon_widget.setFixedSize(size)
+            self.__icon_widget.setIconSize(size)
+        self.__update_icon_widget()
 
     def isShowIconSeparator(self) -> bool:
         """Get whether the icon separator is enabled
@@ -1020,10 +1085,8 @@ class Toast(QDialog):
             return
         self.__show_icon_separator = on
 
-        if on:
-            self.__icon_separator.setFixedWidth(self.__icon_separator_width)
-        else:
-            self.__icon_separator.setFixedWidth(0)
+        if self.__icon_separator is not None:
+            self.__icon_separator.setFixedWidth(self.__icon_separator_width if on else 0)
 
     def getIconSeparatorWidth(self) -> int:
         """Get the width of the icon separator
@@ -1043,7 +1106,7 @@ class Toast(QDialog):
             return
         self.__icon_separator_width = width
 
-        if self.__show_icon_separator:
+        if self.__show_icon_separator and self.__icon_separator is not None:
             self.__icon_separator.setFixedWidth(width)
 
     def getCloseButtonIcon(self) -> QPixmap:
@@ -1054,17 +1117,19 @@ class Toast(QDialog):
 
         return self.__close_button_icon
 
-    def setCloseButtonIcon(self, icon: QPixmap | ToastIcon):
+    def setCloseButtonIcon(self, icon: QPixmap | ToastIcon | str):
         """Set the icon of the close button
 
-        :param icon: new icon
+        :param icon: new icon (pixmap, ToastIcon, name of a registered icon, or path)
         """
 
         if self.__used:
             return
 
-        if type(icon) == ToastIcon:
-            self.__close_button_icon = IconUtils.get_icon_from_enum(icon)
+        if type(icon) == ToastIcon or (type(icon) == str and IconUtils.is_icon_registered(icon)):
+            self.__close_button_icon = IconUtils.get_icon(icon)
+        elif type(icon) == str:
+            self.__close_button_icon = QPixmap(icon)
         else:
             self.__close_button_icon = icon
 
@@ -1356,9 +1421,7 @@ class Toast(QDialog):
             return
 
         self.__icon_color = color
-        recolored_image = IconUtils.recolor_image(QIcon(self.__icon).pixmap(
-                                                  self.__icon_widget.iconSize()).toImage(), color)
-        self.__icon_widget.setIcon(QIcon(QPixmap(recolored_image)))
+        self.__update_icon_widget()
 
     def getIconSeparatorColor(self) -> QColor:
         """Get the color of the icon separator
@@ -1396,9 +1459,8 @@ class Toast(QDialog):
             return
 
         self.__close_button_icon_color = color
-        recolored_image = IconUtils.recolor_image(QIcon(self.__close_button_icon).pixmap(
-                                                  self.__close_button.iconSize()).toImage(), color)
-        self.__close_button.setIcon(QIcon(QPixmap(recolored_image)))
+        self.__close_button.setIcon(QIcon(IconUtils.get_recolored_pixmap(
+            self.__close_button_icon, self.__close_button.iconSize(), color)))
 
     def getDurationBarColor(self) -> QColor:
         """Get the color of the duration bar
@@ -1435,7 +1497,8 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__title_font = font
-        self.__title_label.setFont(font)
+        if self.__title_label is not None:
+            self.__title_label.setFont(font)
 
     def getTextFont(self) -> QFont:
         """Get the font of the text
@@ -1454,7 +1517,8 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__text_font = font
-        self.__text_label.setFont(font)
+        if self.__text_label is not None:
+            self.__text_label.setFont(font)
 
     def getMargins(self) -> QMargins:
         """Get the margins of the toast content
@@ -1924,6 +1988,25 @@ class Toast(QDialog):
             return
         self.__text_section_spacing = spacing
 
+    def getRenderMode(self) -> ToastRenderMode:
+        """Get the render mode of the toast
+
+        :return: render mode
+        """
+
+        return self.__render_mode
+
+    def setRenderMode(self, mode: ToastRenderMode):
+        """Set the render mode of the toast (WIDGETS uses styled child widgets,
+        SINGLE_PAINT draws everything except the close button in one paint event)
+
+        :param mode: new render mode
+        """
+
+        if self.__used:
+            return
+        self.__render_mode = mode
+
     def applyPreset(self, preset: ToastPreset):
         """Apply a style preset to the toast
 
@@ -1981,6 +2064,13 @@ class Toast(QDialog):
     def __update_stylesheet(self):
         """Update the stylesheet of the toast"""
 
+        # Only the close button is a styled widget in single paint mode
+        if self.__render_mode == ToastRenderMode.SINGLE_PAINT:
+            self.__toast_widget.setStyleSheet('background: transparent;'
+                                              'border-radius: {}px;'
+                                              .format(self.__border_radius))
+            return
+
         self.__toast_widget.setStyleSheet('background: {};'
                                           'border-radius: {}px;'
                                           .format(self.__background_color.name(),
@@ -2015,8 +2105,7 @@ class Toast(QDialog):
         :param animate: whether the position change should be animated
         """
 
-        for toast in Toast.__currently_shown:
-            toast.__update_position_xy(animate)
+        Toast.__restack(animate)
 
     @staticmethod
     def __update_currently_showing_position_x(animate: bool = True):
@@ -2025,8 +2114,7 @@ class Toast(QDialog):
         :param animate: whether the position change should be animated
         """
 
-        for toast in Toast.__currently_shown:
-            toast.__update_position_x(animate)
+        Toast.__restack(animate, update_y=False)
 
     @staticmethod
     def __update_currently_showing_position_y(animate: bool = True):
@@ -2035,16 +2123,173 @@ class Toast(QDialog):
         :param animate: whether the position change should be animated
         """
 
-        for toast in Toast.__currently_shown:
-            toast.__update_position_y(animate)
+        Toast.__restack(animate, update_x=False)
 
     @staticmethod
-    def __show_next_in_queue():
-        """Show next toast in queue"""
+    def __restack(animate: bool = True, update_x: bool = True, update_y: bool = True,
+                  entering_toasts: Iterable[Toast] = (), positions: list[tuple[int, int]] | None = None):
+        """Calculate the target positions of all currently shown toasts in one pass
+        and move them there with one shared animation group
+
+        :param animate: whether the position changes should be animated
+        :param update_x: whether the x positions should be updated
+        :param update_y: whether the y positions should be updated
+        :param entering_toasts: toasts that are being shown (animated with their fade in duration)
+        :param positions: already calculated positions of the currently shown toasts (None to calculate them)
+        """
+
+        if Toast.__restack_animation is None:
+            Toast.__restack_animation = QParallelAnimationGroup()
+
+        group = Toast.__restack_animation
+        group.stop()
+        entering_toasts = set(entering_toasts)
+
+        # Release position animations of toasts that are no longer shown
+        for i in reversed(range(group.animationCount())):
+            if group.animationAt(i).targetObject() not in Toast.__currently_shown:
+                group.takeAnimation(i)
 
-        if len(Toast.__queue) > 0:
-            next_toast = Toast.__queue.pop(0)
-            next_toast.show()
+        if positions is None:
+            positions = Toast.__calculate_positions()
+
+        for toast, (x, y) in zip(Toast.__currently_shown, positions):
+            position = QPoint(x if update_x else toast.x(), y if update_y else toast.y())
+
+            if not animate:
+                toast.move(position)
+                continue
+
+            animation = toast.__pos_animation
+            animation.setStartValue(toast.pos())
+            animation.setEndValue(position)
+            animation.setDuration(toast.__fade_in_duration if toast in entering_toasts
+                                  else UPDATE_POSITION_DURATION)
+
+            if group.indexOfAnimation(animation) == -1:
+                group.addAnimation(animation)
+
+        if animate:
+            group.start()
+
+    @staticmethod
+    def __enqueue(toast: Toast | ToastSpec):
+        """Add a toast or toast spec to the queue (the overflow policy is applied if the queue is full)
+
+        :param toast: toast or toast spec to add
+        """
+
+        if Toast.__maximum_queue_size <= 0 or len(Toast.__queue) < Toast.__maximum_queue_size:
+            Toast.__queue.append(toast)
+            return
+
+        policy = Toast.__queue_overflow_policy
+
+        if policy == ToastOverflowPolicy.SUMMARY:
+            Toast.__summarize_overflow(toast)
+            return
+
+        if policy == ToastOverflowPolicy.DROP_OLDEST:
+            dropped_toast = Toast.__queue[0]
+        elif policy == ToastOverflowPolicy.DROP_NEWEST:
+            dropped_toast = toast
+        else:
+            dropped_toast = policy(Toast.__queue, toast)
+            if dropped_toast is not toast and dropped_toast not in Toast.__queue:
+                raise ValueError('Queue overflow policy {!r} returned {!r}, which is neither the new toast '
+                                 'nor a queued toast'.format(policy, dropped_toast))
+
+        if dropped_toast is not toast:
+            Toast.__queue.remove(dropped_toast)
+            Toast.__queue.append(toast)
+        Toast.__drop(dropped_toast)
+
+    @staticmethod
+    def __summarize_overflow(toast: Toast | ToastSpec):
+        """Collapse the overflow of the queue into one summary toast
+
+        :param toast: toast or toast spec that did not fit into the queue
+        """
+
+        summary_toast = Toast.__queue_summary_toast
+
+        # Replace the newest queued toast with a new summary toast
+        if summary_toast is None or summary_toast.__used:
+            newest_toast = Toast.__queue.pop()
+            summary_toast = Toast(newest_toast.parent if isinstance(newest_toast, ToastSpec)
+                                  else newest_toast.parent())
+            Toast.__queue_summary_toast = summary_toast
+            Toast.__queue_summary_count = 0
+            Toast.__queue.append(summary_toast)
+
+            Toast.__drop(newest_toast)
+            Toast.__queue_summary_count += 1
+
+        Toast.__drop(toast)
+        Toast.__queue_summary_count += 1
+        summary_toast.setText(QUEUE_SUMMARY_TEXT.format(Toast.__queue_summary_count))
+
+    @staticmethod
+    def __drop(toast: Toast | ToastSpec):
+        """Drop a toast or toast spec that will never be shown
+
+        :param toast: toast or toast spec to drop
+        """
+
+        Toast.__dropped_count += 1
+        if not isinstance(toast, Toast):
+            return
+
+        # The toast can never be shown anymore, but it is only deleted if it was created here
+        toast.__used = True
+        toast.closed.emit()
+
+        if toast is Toast.__queue_summary_toast:
+            Toast.__queue_summary_toast = None
+            toast.deleteLater()
+        elif toast.__pooled:
+            Toast.__release(toast)
+
+    @staticmethod
+    def __create_from_spec(spec: ToastSpec) -> Toast:
+        """Create a toast from a toast spec
+
+        :param spec: toast spec
+        :return: toast
+        """
+
+        # Taken from the pool so the toast is reused or freed once it is closed
+        toast = Toast.obtain(spec.parent)
+
+        if spec.preset is not None:
+            toast.applyPreset(spec.preset)
+        if spec.icon is not None:
+            toast.setIcon(spec.icon)
+
+        toast.setTitle(spec.title)
+        toast.setText(spec.text)
+        toast.setDuration(spec.duration)
+        toast.setShowIcon(spec.show_icon)
+        toast.setShowDurationBar(spec.show_duration_bar)
+        toast.setShowCloseButton(spec.show_close_button)
+
+        if spec.setup is not None:
+            spec.setup(toast)
+        return toast
+
+    @staticmethod
+    def __show_next_in_queue(count: int = 1):
+        """Show next toasts in queue
+
+        :param count: maximum amount of toasts to show
+        """
+
+        next_toasts = []
+        while len(Toast.__queue) > 0 and len(next_toasts) < count:
+            next_toasts.append(Toast.__queue.popleft())
+
+        if len(next_toasts) > 0:
+            Toast.showMany(next_toasts)
 
     @staticmethod
     def getMaximumOnScreen():
@@ -2067,8 +2312,346 @@ class Toast(QDialog):
         Toast.__maximum_on_screen = maximum_on_screen
 
         if freed_spaces > 0:
-            for i in range(freed_spaces):
-                Toast.__show_next_in_queue()
+            Toast.__show_next_in_queue(freed_spaces)
+
+    @staticmethod
+    def obtain(parent: QWidget | None = None) -> Toast:
+        """Get a toast from the pool of closed toasts or create a new one if the pool
+        is empty. Obtained toasts are returned to the pool once they are closed and
+        reset to their defaults, so they must not be used after they are closed
+
+        :param parent: the parent widget
+        :return: toast with default attributes
+        """
+
+        if len(Toast.__pool) > 0:
+            toast = Toast.__pool.pop()
+            if toast.parent() is not parent:
+                toast.setParent(parent, toast.windowFlags())
+            Toast.__pool_reused_count += 1
+
+            # Disconnect the close event from the slots of the previous use
+            try:
+                toast.closed.disconnect()
+            except (TypeError, RuntimeError):
+                pass
+        else:
+            toast = Toast(parent)
+            toast.__pooled = True
+            Toast.__pool_created_count += 1
+        return toast
+
+    @staticmethod
+    def __release(toast: Toast):
+        """Reset a closed toast and return it to the pool. If the pool is full, the toast is
+        not deleted, but freed as soon as no reference to it is left
+
+        :param toast: closed toast
+        """
+
+        # Detach from the parent so released toasts do not keep it busy or get deleted with it
+        if toast.parent() is not None:
+            toast.setParent(None, toast.windowFlags())
+
+        if len(Toast.__pool) >= Toast.__pool_size:
+            toast.__pooled = False
+            return
+
+        toast.__reset_attributes()
+        Toast.__pool.append(toast)
+
+    def __reset_attributes(self):
+        """Reset the state of a closed toast to the state of a new toast"""
+
+        self.__duration_timer.stop()
+        self.__stop_duration_bar()
+        self.__pos_animation.stop()
+        if self.__fade_animation is not None:
+            self.__fade_animation.stop()
+
+        # Remove the fade state of the previous show
+        self.setGraphicsEffect(None)
+        self.setWindowOpacity(1)
+
+        self.__init_attributes()
+
+        # Remove the size constraints and word wrap of the previous layout
+        self.setMinimumSize(0, 0)
+        self.setMaximumSize(MAXIMUM_WIDGET_SIZE, MAXIMUM_WIDGET_SIZE)
+        labels = [] if self.__title_label is None else [self.__title_label, self.__text_label]
+        for label in labels:
+            label.setMinimumSize(0, 0)
+            label.setMaximumSize(MAXIMUM_WIDGET_SIZE, MAXIMUM_WIDGET_SIZE)
+            label.setWordWrap(False)
+            label.setText('')
+
+        # Show widgets that were hidden by the previous layout
+        for widget in [self.__drop_shadow, self.__close_button] + self.__get_content_widgets():
+            widget.setVisible(True)
+
+        self.__apply_attributes()
+        self.setStyleSheet(Utils.get_stylesheet('toast'))
+
+    @staticmethod
+    def prewarm(pool_size: int = 0, incremental: bool = False,
+                callback: Callable[[dict[str, float]], None] | None = None) -> dict[str, float] | None:
+        """Do the work that would otherwise slow down the first toast ahead of time: load the icons,
+        recolor the preset icons, read the stylesheet, resolve the fonts, and create pooled toasts
+
+        :param pool_size: amount of toasts to create for the pool (limited by the pool size,
+            which can be changed with setPoolSize())
+        :param incremental: whether every stage (and every pooled toast) should run in its own
+            event loop iteration so the event loop is never blocked for long
+        :param callback: called with the timings once everything is done
+        :return: duration of every stage in milliseconds (None if incremental)
+        """
+
+        steps = [('icons', Toast.__prewarm_icons),
+                 ('recolored_icons', Toast.__prewarm_recolored_icons),
+                 ('stylesheets', Toast.__prewarm_stylesheets),
+                 ('fonts', Toast.__prewarm_fonts)]
+        steps += [('pool', Toast.__prewarm_pool)] * max(0, min(pool_size, Toast.__pool_size) - len(Toast.__pool))
+
+        timings = {'icons': 0.0, 'recolored_icons': 0.0, 'stylesheets': 0.0, 'fonts': 0.0, 'pool': 0.0}
+        elapsed_timer = QElapsedTimer()
+
+        def run_step():
+            name, step = steps.pop(0)
+            elapsed_timer.start()
+            step()
+            timings[name] += elapsed_timer.nsecsElapsed() / 1000000
+
+        def run_next_step():
+            run_step()
+            if len(steps) > 0:
+                QTimer.singleShot(0, run_next_step)
+            elif callback is not None:
+                callback(timings)
+
+        if incremental:
+            QTimer.singleShot(0, run_next_step)
+            return None
+
+        while len(steps) > 0:
+            run_step()
+        if callback is not None:
+            callback(timings)
+        return timings
+
+    @staticmethod
+    def __prewarm_icons():
+        """Load all built-in icons"""
+
+        for icon in ToastIcon:
+            IconUtils.get_icon(icon)
+
+    @staticmethod
+    def __prewarm_recolored_icons():
+        """Recolor the icons in the colors used by the default toast and the presets"""
+
+        for icon, color in [(ToastIcon.SUCCESS, SUCCESS_ACCENT_COLOR),
+                            (ToastIcon.WARNING, WARNING_ACCENT_COLOR),
+                            (ToastIcon.ERROR, ERROR_ACCENT_COLOR),
+                            (ToastIcon.INFORMATION, INFORMATION_ACCENT_COLOR)]:
+            IconUtils.get_recolored_pixmap(IconUtils.get_icon(icon), DEFAULT_ICON_SIZE, DEFAULT_ACCENT_COLOR)
+            IconUtils.get_recolored_pixmap(IconUtils.get_icon(icon), DEFAULT_ICON_SIZE, color)
+
+        for color in [DEFAULT_CLOSE_BUTTON_ICON_COLOR, DEFAULT_CLOSE_BUTTON_ICON_COLOR_DARK]:
+            IconUtils.get_recolored_pixmap(IconUtils.get_icon(ToastIcon.CLOSE),
+                                           DEFAULT_CLOSE_BUTTON_ICON_SIZE, color)
+
+    @staticmethod
+    def __prewarm_stylesheets():
+        """Read the stylesheet of the toasts"""
+
+        Utils.get_stylesheet('toast')
+
+    @staticmethod
+    def __prewarm_fonts():
+        """Resolve the default fonts and their metrics"""
+
+        for font in [QFont('Arial', 9, QFont.Weight.Bold), QFont('Arial', 9)]:
+            QFontInfo(font).family()
+            TextUtils.get_text_height(font, '')
+
+    @staticmethod
+    def __prewarm_pool():
+        """Create a toast (including its native window) and add it to the pool"""
+
+        # The pool could have been filled or shrunk in the meantime (incremental mode)
+        if len(Toast.__pool) >= Toast.__pool_size:
+            return
+
+        toast = Toast()
+        toast.__pooled = True
+        toast.winId()
+        Toast.__pool.append(toast)
+
+    @staticmethod
+    def getPoolSize() -> int:
+        """Get the maximum amount of closed toasts kept for reuse
+
+        :return: pool size
+        """
+
+        return Toast.__pool_size
+
+    @staticmethod
+    def setPoolSize(pool_size: int):
+        """Set the maximum amount of closed toasts kept for reuse
+
+        :param pool_size: new pool size (0 to disable reuse)
+        """
+
+        Toast.__pool_size = pool_size
+
+        # Removed toasts are freed as soon as no reference to them is left
+        while len(Toast.__pool) > pool_size:
+            Toast.__pool.pop().__pooled = False
+
+    @staticmethod
+    def getPoolCount() -> int:
+        """Get the amount of closed toasts in the pool that are ready for reuse
+
+        :return: the amount of pooled toasts
+        """
+
+        return len(Toast.__pool)
+
+    @staticmethod
+    def getPoolCreatedCount() -> int:
+        """Get the amount of toasts that had to be created by obtain()
+
+        :return: the amount of created toasts
+        """
+
+        return Toast.__pool_created_count
+
+    @staticmethod
+    def getPoolReusedCount() -> int:
+        """Get the amount of toasts that were reused by obtain()
+
+        :return: the amount of reused toasts
+        """
+
+        return Toast.__pool_reused_count
+
+    @staticmethod
+    def showSpec(spec: ToastSpec) -> Toast | None:
+        """Show a toast described by a toast spec. If the maximum amount of toasts
+        is already shown, only the spec is queued and the toast is created once it
+        can be shown, which keeps the queue lightweight
+
+        :param spec: toast spec
+        :return: the toast if it was shown right away, else None (must not be used after it is closed)
+        """
+
+        if Toast.__maximum_on_screen > len(Toast.__currently_shown):
+            toast = Toast.__create_from_spec(spec)
+            toast.show()
+            return toast
+
+        Toast.__enqueue(spec)
+        return None
+
+    @staticmethod
+    def showMany(toasts: Iterable[Toast | ToastSpec]) -> list[Toast]:
+        """Show many toasts and toast specs at once. As many as fit on the screen are shown
+        and the rest is queued, with only one position update of all shown toasts at the end
+
+        :param toasts: toasts and toast specs (in the order they should be shown)
+        :return: the toasts that were shown right away
+        """
+
+        entering_toasts = []
+
+        for toast in toasts:
+            if isinstance(toast, Toast) and toast.__used:
+                continue
+
+            if Toast.__maximum_on_screen > len(Toast.__currently_shown):
+                if isinstance(toast, ToastSpec):
+                    toast = Toast.__create_from_spec(toast)
+                toast.__admit()
+                entering_toasts.append(toast)
+            else:
+                Toast.__enqueue(toast)
+
+        if len(entering_toasts) > 0:
+            Toast.__enter(entering_toasts)
+        return entering_toasts
+
+    @staticmethod
+    def post(spec: ToastSpec):
+        """Show a toast described by a toast spec from any thread. The specs are
+        collected and shown in batches by the GUI thread (one wakeup per batch)
+
+        :param spec: toast spec
+        """
+
+        # Posting under the lock keeps a concurrent reset() from discarding the inbox in between
+        with Toast.__inbox_lock:
+            if Toast.__inbox is None:
+                Toast.__inbox = ToastInbox(Toast.__show_posted)
+                Toast.__inbox.moveToThread(QGuiApplication.instance().thread())
+            Toast.__inbox.post(spec)
+
+    @staticmethod
+    def __show_posted(specs: list[ToastSpec]):
+        """Show a batch of toast specs that were posted
+
+        :param specs: toast specs
+        """
+
+        Toast.showMany(specs)
+
+    @staticmethod
+    def getMaximumQueueSize() -> int:
+        """Get the maximum amount of toasts allowed in the queue
+
+        :return: maximum queue size (0 if the queue is unlimited)
+        """
+
+        return Toast.__maximum_queue_size
+
+    @staticmethod
+    def setMaximumQueueSize(maximum_queue_size: int):
+        """Set the maximum amount of toasts allowed in the queue
+        (toasts that are already queued are kept)
+
+        :param maximum_queue_size: new maximum queue size (0 for an unlimited queue)
+        """
+
+        Toast.__maximum_queue_size = maximum_queue_size
+
+    @staticmethod
+    def getQueueOverflowPolicy() -> ToastOverflowPolicy | Callable:
+        """Get the policy deciding which toast is dropped if the queue is full
+
+        :return: overflow policy
+        """
+
+        return Toast.__queue_overflow_policy
+
+    @staticmethod
+    def setQueueOverflowPolicy(policy: ToastOverflowPolicy | Callable):
+        """Set the policy deciding which toast is dropped if the queue is full. A custom policy
+        is called with the queue and the new toast (or toast spec) and returns the one to drop
+        (the new toast or a queued toast, anything else raises a ValueError when the queue overflows)
+
+        :param policy: new overflow policy
+        """
+
+        Toast.__queue_overflow_policy = policy
+
+    @staticmethod
+    def getDroppedCount() -> int:
+        """Get the amount of toasts that were dropped because the queue was full
+
+        :return: the amount of dropped toasts
+        """
+
+        return Toast.__dropped_count
 
     @staticmethod
     def getSpacing() -> int:
@@ -2164,20 +2747,9 @@ class Toast(QDialog):
         :param widget: widget that the position is relative to
         """
 
-        if widget is None:
-            # Remove event filters
-            for toast in Toast.__currently_shown + Toast.__queue:
-                toast.__remove_widget_event_filter()
-                toast.__remove_watched_widgets_event_filters()
-
         Toast.__position_relative_to_widget = widget
-
-        if widget is not None:
-            # Install event filters
-            for toast in Toast.__currently_shown + Toast.__queue:
-                toast.__install_widget_event_filter()
-                toast.__install_watched_widgets_event_filters()
-
+        Toast.__invalidate_bounds()
+        Toast.__update_anchor_watcher()
         Toast.__update_currently_showing_position_xy()
 
     @staticmethod
@@ -2197,17 +2769,33 @@ class Toast(QDialog):
         """
 
         Toast.__move_position_with_widget = on
+        Toast.__invalidate_bounds()
+        Toast.__update_anchor_watcher()
 
-        if on:
-            # Install event filters
-            for toast in Toast.__currently_shown + Toast.__queue:
-                toast.__install_widget_event_filter()
-                toast.__install_watched_widgets_event_filters()
-        else:
-            # Remove event filters
-            for toast in Toast.__currently_shown + Toast.__queue:
-                toast.__remove_widget_event_filter()
-                toast.__remove_watched_widgets_event_filters()
+    @staticmethod
+    def isCoalesceWidgetEvents() -> bool:
+        """Get whether position updates caused by the widget moving or resizing
+        are coalesced into one update per frame
+
+        :return: whether position updates are coalesced
+        """
+
+        return Toast.__coalesce_widget_events
+
+    @staticmethod
+    def setCoalesceWidgetEvents(on: bool):
+        """Set whether position updates caused by the widget moving or resizing
+        should be coalesced into one update per frame
+
+        :param on: whether position updates should be coalesced
+        """
+
+        Toast.__coalesce_widget_events = on
+
+        # Apply a pending update right away
+        if not on and Toast.__coalesce_timer is not None and Toast.__coalesce_timer.isActive():
+            Toast.__coalesce_timer.stop()
+            Toast.__apply_coalesced_position_update()
 
     @staticmethod
     def isAlwaysOnMainScreen() -> bool:
@@ -2226,6 +2814,7 @@ class Toast(QDialog):
         """
 
         Toast.__always_on_main_screen = on
+        Toast.__invalidate_bounds()
         Toast.__update_currently_showing_position_xy()
 
     @staticmethod
@@ -2245,6 +2834,7 @@ class Toast(QDialog):
         """
 
         Toast.__fixed_screen = screen
+        Toast.__invalidate_bounds()
         Toast.__update_currently_showing_position_xy()
 
     @staticmethod
@@ -2266,6 +2856,97 @@ class Toast(QDialog):
         Toast.__position = position
         Toast.__update_currently_showing_position_xy()
 
+    @staticmethod
+    def getFrameRate() -> float:
+        """Get the maximum frame rate of the duration bar animation
+
+        :return: frame rate (0 if the refresh rate of the screen is used)
+        """
+
+        return Toast.__frame_rate
+
+    @staticmethod
+    def setFrameRate(frame_rate: float):
+        """Set the maximum frame rate of the duration bar animation
+
+        :param frame_rate: new frame rate (0 to use the refresh rate of the screen)
+        """
+
+        Toast.__frame_rate = frame_rate
+
+        if Toast.__duration_bar_ticker is not None and Toast.__duration_bar_ticker.isActive():
+            Toast.__duration_bar_ticker.setInterval(Toast.__get_frame_interval())
+
+    @staticmethod
+    def getFadeBackend() -> ToastFadeBackend:
+        """Get the fade backend used for the fade in and fade out animations
+
+        :return: fade backend
+        """
+
+        return Toast.__fade_backend
+
+    @staticmethod
+    def setFadeBackend(fade_backend: ToastFadeBackend):
+        """Set the fade backend used for the fade in and fade out animations
+        (only affects toasts that are shown afterwards)
+
+        :param fade_backend: new fade backend
+        """
+
+        Toast.__fade_backend = fade_backend
+
+    @staticmethod
+    def getActiveFadeBackend() -> ToastFadeBackend:
+        """Get the fade backend that is actually used. If the window opacity
+        is not supported by the platform, the graphics effect is used instead
+
+        :return: active fade backend
+        """
+
+        if (Toast.__fade_backend == ToastFadeBackend.WINDOW_OPACITY
+                and not Utils.is_window_opacity_supported()):
+            return ToastFadeBackend.GRAPHICS_EFFECT
+        return Toast.__fade_backend
+
+    @staticmethod
+    def getStackPositions() -> list[QPoint]:
+        """Get the target positions of all currently shown toasts
+
+        :return: target positions (in the order the toasts were shown)
+        """
+
+        return [QPoint(x, y) for x, y in Toast.__calculate_positions()]
+
+    @staticmethod
+    def registerIcon(name: str, icon: QPixmap | str):
+        """Register a custom icon that can be used by name with
+        setIcon() and setCloseButtonIcon() (names take precedence over paths)
+
+        :param name: name of the icon
+        :param icon: pixmap or path of the icon
+        """
+
+        IconUtils.register_icon(name, icon)
+
+    @staticmethod
+    def getDefaultStyleSheet() -> str:
+        """Get the stylesheet that is applied to every new toast
+
+        :return: stylesheet
+        """
+
+        return Utils.get_stylesheet('toast')
+
+    @staticmethod
+    def setDefaultStyleSheet(stylesheet: str | None):
+        """Set the stylesheet that is applied to every new toast
+
+        :param stylesheet: new stylesheet (None to use the bundled one again)
+        """
+
+        Utils.set_stylesheet('toast', stylesheet)
+
     @staticmethod
     def getCount() -> int:
         """Get the amount of toasts that are either currently visible
@@ -2294,6 +2975,16 @@ class Toast(QDialog):
 
         return len(Toast.__queue)
 
+    @staticmethod
+    def getQueue() -> deque[Toast | ToastSpec]:
+        """Get the toasts and toast specs in the queue to be shown. The queue
+        itself is returned without copying, so it should not be modified
+
+        :return: queued toasts and toast specs (next toast to be shown first)
+        """
+
+        return Toast.__queue
+
     @staticmethod
     def reset():
         """Reset the Toast class completely (reset static attributes
@@ -2301,6 +2992,8 @@ class Toast(QDialog):
 
         # Reset static attributes
         Toast.__maximum_on_screen = 3
+        Toast.__maximum_queue_size = 0
+        Toast.__queue_overflow_policy = ToastOverflowPolicy.DROP_OLDEST
         Toast.__spacing = 10
         Toast.__offset_x = 20
         Toast.__offset_y = 45
@@ -2309,15 +3002,49 @@ class Toast(QDialog):
         Toast.__always_on_main_screen = False
         Toast.__fixed_screen = None
         Toast.__position = ToastPosition.BOTTOM_RIGHT
+        Toast.__frame_rate = 0
+        Toast.__fade_backend = ToastFadeBackend.GRAPHICS_EFFECT
+        Toast.__invalidate_bounds()
+        Utils.set_stylesheet('toast', None)
 
         # Hide currently showing toasts and clear queue
         for toast in Toast.__currently_shown:
             toast.setVisible(False)
             toast.deleteLater()
 
-        # Remove event filters on watched widgets
-        for toast in Toast.__currently_shown + Toast.__queue:
-            toast.__remove_watched_widgets_event_filters()
+        # Stop watching the widget the position was relative to
+        Toast.__update_anchor_watcher()
+        Toast.__coalesce_widget_events = False
+        if Toast.__coalesce_timer is not None:
+            Toast.__coalesce_timer.stop()
 
         Toast.__currently_shown.clear()
         Toast.__queue.clear()
+        Toast.__dropped_count = 0
+        Toast.__queue_summary_toast = None
+        Toast.__queue_summary_count = 0
+
+        # Discard toast specs that were posted but not shown yet
+        with Toast.__inbox_lock:
+            if Toast.__inbox is not None:
+                Toast.__inbox.deleteLater()
+                Toast.__inbox = None
+
+        # Clear the pool (the toasts are freed as soon as no reference to them is left)
+        for toast in Toast.__pool:
+            toast.__pooled = False
+        Toast.__pool.clear()
+        Toast.__pool_size = DEFAULT_POOL_SIZE
+        Toast.__pool_created_count = 0
+        Toast.__pool_reused_count = 0
+
+        # Stop moving toasts and release their position animations
+        if Toast.__restack_animation is not None:
+            Toast.__restack_animation.stop()
+            while Toast.__restack_animation.animationCount() > 0:
+                Toast.__restack_animation.takeAnimation(0)
+
+        # Stop updating duration bars
+        Toast.__animated_duration_bars.clear()
+        if Toast.__duration_bar_ticker is not None:
+            Toast.__duration_bar_ticker.stop()
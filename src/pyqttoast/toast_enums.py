@@ -34,3 +34,20 @@ class ToastButtonAlignment(Enum):
     TOP = 1
     MIDDLE = 2
     BOTTOM = 3
+
+
+class ToastRenderMode(Enum):
+    WIDGETS = 1
+    SINGLE_PAINT = 2
+
+
+class ToastFadeBackend(Enum):
+    GRAPHICS_EFFECT = 1
+    WINDOW_OPACITY = 2
+    NONE = 3
+
+
+class ToastOverflowPolicy(Enum):
+    DROP_OLDEST = 1
+    DROP_NEWEST = 2
+    SUMMARY = 3
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable
+from qtpy.QtCore import QObject, Qt, Signal, Slot
+
+
+class ToastInbox(QObject):
+
+    # Emitted once for every batch of posted items (queued to the thread of the inbox)
+    received = Signal()
+
+    def __init__(self, handler: Callable[[list], None], parent: QObject | None = None):
+        """Create a new ToastInbox instance
+
+        :param handler: called in the thread of the inbox with every batch of posted items
+        :param parent: the parent object
+        """
+
+        super(ToastInbox, self).__init__(parent)
+
+        self.__handler = handler
+        self.__lock = threading.Lock()
+        self.__items = []
+        self.__wakeup_pending = False
+
+        self.received.connect(self.__drain, Qt.ConnectionType.QueuedConnection)
+
+    def post(self, item):
+        """Add an item to the inbox (can be called from any thread).
+        Only the first item of a batch wakes up the thread of the inbox
+
+        :param item: item to add
+        """
+
+        with self.__lock:
+            self.__items.append(item)
+            if self.__wakeup_pending:
+                return
+            self.__wakeup_pending = True
+
+        self.received.emit()
+
+    # Decorated so the queued call is delivered to the thread the inbox lives in,
+    # even if the inbox was created in another thread and moved afterwards
+    @Slot()
+    def __drain(self):
+        """Pass all posted items to the handler"""
+
+        with self.__lock:
+            items = self.__items
+            self.__items = []
+            self.__wakeup_pending = False
+
+        self.__handler(items)
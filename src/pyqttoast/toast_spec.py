@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Callable, TYPE_CHECKING
+from qtpy.QtGui import QPixmap
+from qtpy.QtWidgets import QWidget
+from .toast_enums import ToastPreset, ToastIcon
+
+if TYPE_CHECKING:
+    from .toast import Toast
+
+
+class ToastSpec:
+
+    __slots__ = ('title', 'text', 'duration', 'preset', 'icon', 'show_icon',
+                 'show_duration_bar', 'show_close_button', 'parent', 'setup')
+
+    def __init__(self, title: str = '', text: str = '', duration: int = 5000,
+                 preset: ToastPreset | None = None, icon: QPixmap | ToastIcon | str | None = None,
+                 show_icon: bool = False, show_duration_bar: bool = True,
+                 show_close_button: bool = True, parent: QWidget | None = None,
+                 setup: Callable[[Toast], None] | None = None):
+        """Create a new ToastSpec instance. A spec only holds the data of a toast,
+        the toast itself is created once it is shown
+
+        :param title: title of the toast
+        :param text: text of the toast
+        :param duration: duration of the toast in milliseconds (0 = infinite)
+        :param preset: style preset applied to the toast
+        :param icon: icon of the toast (applied after the preset)
+        :param show_icon: whether the icon should be shown
+        :param show_duration_bar: whether the duration bar should be shown
+        :param show_close_button: whether the close button should be shown
+        :param parent: parent widget of the toast
+        :param setup: called with the created toast to apply further settings
+        """
+
+        self.title = title
+        self.text = text
+        self.duration = duration
+        self.preset = preset
+        self.icon = icon
+        self.show_icon = show_icon
+        self.show_duration_bar = show_duration_bar
+        self.show_close_button = show_close_button
+        self.parent = parent
+        self.setup = setup
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import os
+from qtpy.QtGui import QGuiApplication
 from qtpy.QtWidgets import QWidget
 
 
 class Utils:
 
+    # Platforms that ignore the window opacity (no compositor, or not supported by the protocol)
+    __platforms_without_window_opacity = ('offscreen', 'minimal', 'minimalegl', 'vnc', 'linuxfb', 'eglfs')
+    __platform_prefixes_without_window_opacity = ('wayland',)
+
+    # Contents of the stylesheets (loaded once per process)
+    __stylesheets = {}
+    __stylesheet_overrides = {}
+
     @staticmethod
     def get_current_directory() -> str:
         """Get the current directory path
@@ -15,6 +24,37 @@ class Utils:
 
         return os.path.dirname(os.path.realpath(__file__))
 
+    @staticmethod
+    def get_stylesheet(name: str) -> str:
+        """Get the contents of a stylesheet from the css directory.
+        The file is only read the first time, after that the cached
+        contents (or the override if one is set) are returned
+
+        :param name: name of the stylesheet without extension (e.g. 'toast')
+        :return: stylesheet
+        """
+
+        if name in Utils.__stylesheet_overrides:
+            return Utils.__stylesheet_overrides[name]
+
+        if name not in Utils.__stylesheets:
+            with open(Utils.get_current_directory() + '/css/' + name + '.css') as file:
+                Utils.__stylesheets[name] = file.read()
+        return Utils.__stylesheets[name]
+
+    @staticmethod
+    def set_stylesheet(name: str, stylesheet: str | None):
+        """Override a stylesheet globally
+
+        :param name: name of the stylesheet without extension (e.g. 'toast')
+        :param stylesheet: new stylesheet (None to use the default one again)
+        """
+
+        if stylesheet is None:
+            Utils.__stylesheet_overrides.pop(name, None)
+        else:
+            Utils.__stylesheet_overrides[name] = stylesheet
+
     @staticmethod
     def get_top_level_parent(widget: QWidget) -> QWidget:
         """Get the top level parent of a widget. If the widget has no parent,
@@ -47,3 +87,16 @@ class Utils:
             parents.append(widget.parent())
             widget = widget.parent()
         return parents
+
+    @staticmethod
+    def is_window_opacity_supported() -> bool:
+        """Check whether the platform can change the opacity of top level windows.
+        This is only a heuristic based on the platform name: on X11 (xcb) a running
+        compositing manager is assumed, since Qt cannot detect it
+
+        :return: whether window opacity is supported
+        """
+
+        platform_name = QGuiApplication.platformName()
+        return (platform_name not in Utils.__platforms_without_window_opacity
+                and not platform_name.startswith(Utils.__platform_prefixes_without_window_opacity))
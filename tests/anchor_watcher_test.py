@@ -0,0 +1,30 @@
+from PyQt6.QtWidgets import QMainWindow, QWidget
+from src.pyqttoast.anchor_watcher import AnchorWatcher
+
+
+def test_anchor_watcher(qtbot):
+    """Test that moving or resizing the widget or one of its parents emits one change"""
+
+    window = QMainWindow()
+    widget = QWidget(window)
+    window.setGeometry(100, 100, 400, 300)
+    window.show()
+    qtbot.addWidget(window)
+
+    watcher = AnchorWatcher()
+    changes = []
+    watcher.changed.connect(lambda: changes.append(True))
+    watcher.set_widget(widget)
+    assert watcher.get_widget() is widget
+
+    widget.move(20, 20)
+    qtbot.waitUntil(lambda: len(changes) == 1, timeout=1000)
+
+    widget.resize(50, 50)
+    qtbot.waitUntil(lambda: len(changes) == 2, timeout=1000)
+
+    # No changes are emitted once the widget is not watched anymore
+    watcher.set_widget(None)
+    widget.move(40, 40)
+    qtbot.wait(50)
+    assert len(changes) == 2
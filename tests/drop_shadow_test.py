@@ -0,0 +1,45 @@
+import pytest
+from PyQt6.QtCore import Qt, QSize, QRectF
+from PyQt6.QtGui import QPixmap, QPainter, QColor
+from src.pyqttoast.drop_shadow import DropShadow
+from src.pyqttoast.constants import DROP_SHADOW_BORDER_RADIUS, DROP_SHADOW_LAYER_ALPHAS
+
+
+def draw_shadow_layers(width: int, height: int) -> QPixmap:
+    """Reference implementation of the drop shadow (layers drawn at full size)"""
+
+    pixmap = QPixmap(width, height)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+
+    for i, alpha in enumerate(DROP_SHADOW_LAYER_ALPHAS):
+        painter.setBrush(QColor(0, 0, 0, alpha))
+        painter.drawRoundedRect(QRectF(i, i, width - i * 2, height - i * 2),
+                                DROP_SHADOW_BORDER_RADIUS, DROP_SHADOW_BORDER_RADIUS)
+
+    painter.end()
+    return pixmap
+
+
+@pytest.mark.parametrize('size', [QSize(310, 85), QSize(100, 40), QSize(20, 20), QSize(27, 500)])
+def test_get_pixmap(qtbot, size):
+    """Test that the nine-slice shadow matches the shadow drawn at full size"""
+
+    DropShadow.clear_cache()
+    pixmap = DropShadow.get_pixmap(size)
+
+    assert pixmap.size() == size
+    assert pixmap.toImage() == draw_shadow_layers(size.width(), size.height()).toImage()
+    assert DropShadow.get_pixmap(size).cacheKey() == pixmap.cacheKey()
+
+
+def test_get_pixmap_device_pixel_ratio(qtbot):
+    """Test getting a shadow pixmap for a high DPI screen"""
+
+    pixmap = DropShadow.get_pixmap(QSize(200, 60), 2.0)
+
+    assert pixmap.size() == QSize(400, 120)
+    assert pixmap.devicePixelRatio() == 2.0
+    assert DropShadow.get_pixmap(QSize(200, 60), 1.0).cacheKey() != pixmap.cacheKey()
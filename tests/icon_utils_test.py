@@ -1,5 +1,7 @@
 import os
-from PyQt6.QtGui import QPixmap
+import pytest
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QPixmap, QImage, QColor, QIcon, qRgba
 from src.pyqttoast import ToastIcon
 from src.pyqttoast.icon_utils import IconUtils
 
@@ -21,3 +23,138 @@ def test_get_icon_from_enum(qtbot):
     assert IconUtils.get_icon_from_enum(ToastIcon.WARNING).toImage() == warning_image
     assert IconUtils.get_icon_from_enum(ToastIcon.ERROR).toImage() == error_image
     assert IconUtils.get_icon_from_enum(ToastIcon.CLOSE).toImage() == close_image
+
+
+def recolor_image_per_pixel(image: QImage, color: QColor) -> QImage:
+    """Reference implementation of IconUtils.recolor_image (per-pixel loop)"""
+
+    for x in range(0, image.width()):
+        for y in range(0, image.height()):
+            current_color = image.pixelColor(x, y)
+            new_color = QColor.fromRgba(
+                qRgba(color.red(), color.green(), color.blue(), current_color.alpha()))
+            image.setPixelColor(x, y, new_color)
+    return image
+
+
+def test_recolor_image(qtbot):
+    """Test recoloring an image against the per-pixel reference implementation"""
+
+    colors = [QColor('#3E9141'), QColor('#BA2626'), QColor('#000000'), QColor(255, 255, 255, 100)]
+
+    for enum_icon in ToastIcon:
+        for size in [QSize(10, 10), QSize(18, 18), QSize(35, 35)]:
+            for color in colors:
+                image = QIcon(IconUtils.get_icon_from_enum(enum_icon)).pixmap(size).toImage()
+                expected_image = recolor_image_per_pixel(image.copy(), color)
+
+                assert IconUtils.recolor_image(image, color) == expected_image
+
+
+def test_recolor_image_without_color(qtbot):
+    """Test recoloring an image with None (should return the image unchanged)"""
+
+    image = IconUtils.get_icon_from_enum(ToastIcon.SUCCESS).toImage()
+    assert IconUtils.recolor_image(image, None) is image
+
+
+def test_get_recolored_pixmap(qtbot):
+    """Test getting recolored pixmaps from the cache"""
+
+    IconUtils.clear_cache()
+    pixmap = IconUtils.get_icon_from_enum(ToastIcon.SUCCESS)
+    size = QSize(18, 18)
+    color = QColor('#3E9141')
+
+    expected_image = recolor_image_per_pixel(QIcon(pixmap).pixmap(size).toImage(), color)
+    recolored_pixmap = IconUtils.get_recolored_pixmap(pixmap, size, color)
+
+    assert recolored_pixmap.toImage() == expected_image
+    assert IconUtils.get_cache_hits() == 0
+    assert IconUtils.get_cache_misses() == 1
+
+    assert IconUtils.get_recolored_pixmap(pixmap, size, color).cacheKey() == recolored_pixmap.cacheKey()
+    assert IconUtils.get_cache_hits() == 1
+    assert IconUtils.get_cache_misses() == 1
+
+    IconUtils.get_recolored_pixmap(pixmap, size, QColor('#BA2626'))
+    IconUtils.get_recolored_pixmap(pixmap, QSize(10, 10), color)
+    assert IconUtils.get_cache_misses() == 3
+
+    IconUtils.clear_cache()
+    assert IconUtils.get_cache_hits() == 0
+    assert IconUtils.get_cache_misses() == 0
+
+
+def test_get_recolored_pixmap_device_pixel_ratio(qtbot):
+    """Test getting recolored pixmaps for different device pixel ratios"""
+
+    pixmap = IconUtils.get_icon_from_enum(ToastIcon.SUCCESS)
+    color = QColor('#3E9141')
+
+    for device_pixel_ratio, pixel_size in [(1.0, QSize(18, 18)), (2.0, QSize(36, 36)), (1.5, QSize(27, 27))]:
+        recolored_pixmap = IconUtils.get_recolored_pixmap(pixmap, QSize(18, 18), color, device_pixel_ratio)
+        assert recolored_pixmap.size() == pixel_size
+        assert recolored_pixmap.devicePixelRatio() == device_pixel_ratio
+
+    # Small pixmaps are not scaled up
+    small_pixmap = pixmap.scaled(20, 20)
+    recolored_pixmap = IconUtils.get_recolored_pixmap(small_pixmap, QSize(18, 18), color, 2.0)
+    assert recolored_pixmap.size() == QSize(20, 20)
+
+
+def test_set_cache_max_size(qtbot):
+    """Test limiting the size of the recolored pixmap cache"""
+
+    IconUtils.clear_cache()
+    max_size = IconUtils.get_cache_max_size()
+    IconUtils.set_cache_max_size(2)
+    pixmap = IconUtils.get_icon_from_enum(ToastIcon.ERROR)
+
+    IconUtils.get_recolored_pixmap(pixmap, QSize(10, 10), QColor('#000000'))
+    IconUtils.get_recolored_pixmap(pixmap, QSize(11, 11), QColor('#000000'))
+    IconUtils.get_recolored_pixmap(pixmap, QSize(12, 12), QColor('#000000'))
+
+    # Least recently used entry should have been evicted
+    IconUtils.get_recolored_pixmap(pixmap, QSize(10, 10), QColor('#000000'))
+    assert IconUtils.get_cache_hits() == 0
+    assert IconUtils.get_cache_misses() == 4
+
+    IconUtils.get_recolored_pixmap(pixmap, QSize(12, 12), QColor('#000000'))
+    assert IconUtils.get_cache_hits() == 1
+
+    IconUtils.set_cache_max_size(max_size)
+    IconUtils.clear_cache()
+
+
+def test_get_icon_shares_data(qtbot):
+    """Test that bundled icons are only loaded once and share their data"""
+
+    assert (IconUtils.get_icon(ToastIcon.WARNING).cacheKey()
+            == IconUtils.get_icon_from_enum(ToastIcon.WARNING).cacheKey())
+
+
+def test_register_icon(qtbot):
+    """Test registering and unregistering a custom icon"""
+
+    pixmap = QPixmap(ROOT_PATH + '/src/pyqttoast/icons/success.png')
+    IconUtils.register_icon('custom', pixmap)
+
+    assert IconUtils.is_icon_registered('custom') == True
+    assert IconUtils.get_icon('custom').toImage() == pixmap.toImage()
+
+    IconUtils.unregister_icon('custom')
+    assert IconUtils.is_icon_registered('custom') == False
+
+    with pytest.raises(ValueError):
+        IconUtils.get_icon('custom')
+
+    # Icons that cannot be loaded are rejected
+    with pytest.raises(ValueError):
+        IconUtils.register_icon('missing', ROOT_PATH + '/missing.png')
+    assert IconUtils.is_icon_registered('missing') == False
+
+    # Bundled icons cannot be unregistered
+    IconUtils.get_icon(ToastIcon.SUCCESS)
+    IconUtils.unregister_icon(ToastIcon.SUCCESS)
+    assert IconUtils.is_icon_registered(ToastIcon.SUCCESS) == True
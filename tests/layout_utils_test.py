@@ -0,0 +1,136 @@
+from src.pyqttoast import ToastButtonAlignment, ToastPosition
+from src.pyqttoast.layout_utils import LayoutUtils, LayoutMargins, LayoutRect, ToastLayoutOptions
+
+
+def create_options(**kwargs) -> ToastLayoutOptions:
+    """Create layout options with the default values of a toast"""
+
+    options = dict(
+        margins=LayoutMargins(20, 18, 10, 18),
+        icon_margins=LayoutMargins(0, 0, 15, 0),
+        icon_section_margins=LayoutMargins(0, 0, 15, 0),
+        text_section_margins=LayoutMargins(0, 0, 15, 0),
+        close_button_margins=LayoutMargins(0, -8, 0, -8),
+        icon_size=(18, 18),
+        icon_separator_width=2,
+        close_button_size=(24, 24),
+        close_button_alignment=ToastButtonAlignment.TOP,
+        text_section_spacing=8,
+        duration_bar_height=4,
+        show_icon=False,
+        show_close_button=True,
+        has_title=True,
+        has_text=True,
+        minimum_size=(0, 0),
+        maximum_size=(16777215, 16777215)
+    )
+    options.update(kwargs)
+    return ToastLayoutOptions(**options)
+
+
+def measure_wrapped(width: int) -> tuple[int, int, int, int]:
+    """Fake measurement of a 10 px high title with 100 px
+    and a 10 px high text with 300 px on a single line"""
+
+    width = max(width, 20)
+    return (min(width, 100), -(-100 // width) * 10,
+            min(width, 300), -(-300 // width) * 10)
+
+
+def test_calculate_toast_layout():
+    """Test calculating the layout of a toast without any constraints"""
+
+    layout = LayoutUtils.calculate_toast_layout(create_options(), (100, 10), (300, 10), measure_wrapped)
+
+    assert (layout.width, layout.height) == (20 + 300 + 15 + 24 + 10, 18 + 28 + 18 + 4)
+    assert layout.title == LayoutRect(20, 18, 300, 10)
+    assert layout.text == LayoutRect(20, 36, 300, 10)
+    assert layout.close_button == LayoutRect(335, 10, 24, 24)
+    assert layout.duration_bar == LayoutRect(0, 64, 369, 4)
+    assert layout.word_wrap == False
+
+
+def test_calculate_toast_layout_with_icon():
+    """Test calculating the layout of a toast with an icon"""
+
+    layout = LayoutUtils.calculate_toast_layout(create_options(show_icon=True),
+                                                (100, 10), (300, 10), measure_wrapped)
+
+    assert layout.icon == LayoutRect(20, 23, 18, 18)
+    assert layout.icon_separator == LayoutRect(53, 18, 2, 28)
+    assert layout.title.x == 20 + 18 + 15 + 2 + 15
+    assert layout.width == 20 + 50 + 300 + 15 + 24 + 10
+
+
+def test_calculate_toast_layout_maximum_width():
+    """Test calculating the layout of a toast that is wider than its maximum width"""
+
+    layout = LayoutUtils.calculate_toast_layout(create_options(maximum_size=(209, 16777215)),
+                                                (100, 10), (300, 10), measure_wrapped)
+
+    assert layout.width == 209
+    assert layout.title.width == 140
+    assert layout.text.height == 30
+    assert layout.word_wrap == True
+
+
+def test_calculate_toast_layout_minimum_height():
+    """Test calculating the layout of a toast that is lower than its minimum height"""
+
+    layout = LayoutUtils.calculate_toast_layout(create_options(minimum_size=(0, 120)),
+                                                (100, 10), (300, 10), measure_wrapped)
+
+    # Widest text width that still results in a height of at least 120 px
+    assert layout.height == 18 + 20 + 8 + 60 + 18 + 4
+    assert layout.text.width == 59
+    assert layout.word_wrap == True
+
+
+def test_calculate_toast_layout_close_button_alignment():
+    """Test calculating the close button position for every alignment"""
+
+    for alignment, y in [(ToastButtonAlignment.TOP, 10),
+                         (ToastButtonAlignment.MIDDLE, 20),
+                         (ToastButtonAlignment.BOTTOM, 30)]:
+        layout = LayoutUtils.calculate_toast_layout(create_options(close_button_alignment=alignment),
+                                                    (100, 10), (300, 10), measure_wrapped)
+        assert layout.close_button.y == y
+
+
+def calculate_stack_positions_quadratic(position: ToastPosition, toast_sizes: list[tuple[int, int]],
+                                        rect: LayoutRect) -> list[tuple[int, int]]:
+    """Reference implementation summing up the heights of all previous toasts for every toast"""
+
+    positions = []
+    for i, (width, height) in enumerate(toast_sizes):
+        y_offset = sum(toast_sizes[j][1] + 10 for j in range(i))
+        x = {
+            ToastPosition.BOTTOM_LEFT: rect.x + 20,
+            ToastPosition.TOP_RIGHT: rect.width - width - 20 + rect.x,
+            ToastPosition.TOP_MIDDLE: rect.x + rect.width / 2 - width / 2,
+            ToastPosition.CENTER: rect.x + rect.width / 2 - width / 2
+        }[position]
+        y = {
+            ToastPosition.BOTTOM_LEFT: rect.height - height - 45 + rect.y - y_offset,
+            ToastPosition.TOP_RIGHT: rect.y + 45 + y_offset,
+            ToastPosition.TOP_MIDDLE: rect.y + 45 + y_offset,
+            ToastPosition.CENTER: (rect.y + rect.height / 2 - height / 2 if i == 0
+                                   else rect.y + rect.height / 2 - toast_sizes[0][1] / 2 + y_offset)
+        }[position]
+        positions.append((int(x - 5), int(y - 5)))
+    return positions
+
+
+def test_calculate_stack_positions():
+    """Test calculating the positions of stacked toasts"""
+
+    rect = LayoutRect(100, 50, 1920, 1080)
+    toast_sizes = [(300, 68), (251, 93), (369, 75), (120, 41)]
+
+    for position in [ToastPosition.BOTTOM_LEFT, ToastPosition.TOP_RIGHT,
+                     ToastPosition.TOP_MIDDLE, ToastPosition.CENTER]:
+        positions = LayoutUtils.calculate_stack_positions(position, toast_sizes, [rect] * len(toast_sizes),
+                                                          10, (20, 45), 5)
+        assert positions == calculate_stack_positions_quadratic(position, toast_sizes, rect)
+
+    assert LayoutUtils.calculate_stack_positions(ToastPosition.BOTTOM_RIGHT, [], [], 10, (20, 45), 5) == []
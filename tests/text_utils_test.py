@@ -0,0 +1,39 @@
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QFont, QFontMetrics
+from src.pyqttoast.text_utils import TextUtils
+
+
+def test_measure_text(qtbot):
+    """Test measuring single line and word wrapped texts"""
+
+    TextUtils.clear_cache()
+    font = QFont('Arial', 9)
+    font_metrics = QFontMetrics(font)
+    text = 'Check your email to complete signup.'
+    wrapped_rect = font_metrics.boundingRect(QRect(0, 0, 80, 0), Qt.TextFlag.TextWordWrap, text)
+
+    assert TextUtils.get_text_width(font, text) == font_metrics.horizontalAdvance(text)
+    assert TextUtils.get_text_height(font, text) == font_metrics.boundingRect(text).height()
+    assert TextUtils.get_wrapped_text_size(font, text, 80) == (wrapped_rect.width(), wrapped_rect.height())
+
+
+def test_measurement_cache(qtbot):
+    """Test that repeated measurements are served from the cache"""
+
+    TextUtils.clear_cache()
+    font = QFont('Arial', 9, QFont.Weight.Bold)
+
+    TextUtils.get_text_width(font, 'Build finished')
+    TextUtils.get_text_height(font, 'Build finished')
+    TextUtils.get_wrapped_text_size(font, 'Build finished', 50)
+    TextUtils.get_wrapped_text_size(font, 'Build finished', 50)
+
+    assert TextUtils.get_cache_hits() == 2
+    assert TextUtils.get_cache_misses() == 2
+
+    TextUtils.get_text_width(QFont('Arial', 12), 'Build finished')
+    assert TextUtils.get_cache_misses() == 3
+
+    TextUtils.clear_cache()
+    assert TextUtils.get_cache_hits() == 0
+    assert TextUtils.get_cache_misses() == 0
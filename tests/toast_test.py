@@ -1,11 +1,15 @@
 import os
+import threading
 import pytest
 from unittest.mock import patch
-from PyQt6.QtWidgets import QMainWindow
-from PyQt6.QtCore import QSize, QMargins, Qt, QRect
-from PyQt6.QtGui import QColor, QFont, QGuiApplication, QPixmap
-from src.pyqttoast import Toast, ToastPosition, ToastButtonAlignment, ToastPreset, ToastIcon
+from PyQt6.QtWidgets import QMainWindow, QLabel, QPushButton
+from PyQt6.QtCore import QSize, QMargins, Qt, QRect, QAbstractAnimation, QElapsedTimer
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QGuiApplication, QPixmap, QImage
+from src.pyqttoast import Toast, ToastPosition, ToastButtonAlignment, ToastPreset, ToastIcon, ToastRenderMode, \
+    ToastFadeBackend, ToastOverflowPolicy, ToastSpec
 from src.pyqttoast.constants import DROP_SHADOW_SIZE
+from src.pyqttoast.utils import Utils
+from src.pyqttoast.icon_utils import IconUtils
 
 
 ROOT_PATH = os.path.abspath(os.curdir)
@@ -69,6 +73,7 @@ def test_initial_values(qtbot):
     assert toast.getTextSectionMargins() == QMargins(0, 0, 15, 0)
     assert toast.getCloseButtonMargins() == QMargins(0, -8, 0, -8)
     assert toast.getTextSectionSpacing() == 8
+    assert toast.getRenderMode() == ToastRenderMode.WIDGETS
 
 
 def test_setters_after_show(qtbot):
@@ -117,6 +122,7 @@ def test_setters_after_show(qtbot):
     toast.setTextSectionMargins(QMargins(1, 2, 3, 4))
     toast.setCloseButtonMargins(QMargins(1, 2, 3, 4))
     toast.setTextSectionSpacing(5)
+    toast.setRenderMode(ToastRenderMode.SINGLE_PAINT)
 
     assert toast.getDuration() == 5000
     assert toast.isShowDurationBar() == True
@@ -152,6 +158,7 @@ def test_setters_after_show(qtbot):
     assert toast.getTextSectionMargins() == QMargins(0, 0, 15, 0)
     assert toast.getCloseButtonMargins() == QMargins(0, -8, 0, -8)
     assert toast.getTextSectionSpacing() == 8
+    assert toast.getRenderMode() == ToastRenderMode.WIDGETS
 
     toast.setCloseButtonWidth(44)
     toast.setCloseButtonHeight(48)
@@ -205,6 +212,375 @@ def test_count_methods(qtbot):
     assert Toast.getQueuedCount() == 2
 
 
+def test_get_queue(qtbot):
+    """Test getting the queued toasts in the order they will be shown"""
+
+    assert len(Toast.getQueue()) == 0
+
+    toasts = []
+    for i in range(5):
+        toast = Toast()
+        toast.setDuration(0)
+        toast.setFadeInDuration(0)
+        toast.setFadeOutDuration(0)
+        toast.show()
+        qtbot.addWidget(toast)
+        toasts.append(toast)
+
+    queue = Toast.getQueue()
+    assert list(queue) == toasts[3:]
+
+    toasts[0].hide()
+    qtbot.waitUntil(lambda: toasts[3].isVisible(), timeout=1000)
+    assert Toast.getQueue() is queue
+    assert list(queue) == toasts[4:]
+
+
+def create_queued_toasts(qtbot, amount: int) -> list[Toast]:
+    """Show the given amount of toasts (with a maximum of one on screen)"""
+
+    Toast.setMaximumOnScreen(1)
+    toasts = []
+    for i in range(amount):
+        toast = Toast()
+        toast.setText(str(i))
+        toast.show()
+        qtbot.addWidget(toast)
+        toasts.append(toast)
+    return toasts
+
+
+@pytest.mark.parametrize('policy, expected_queue', [
+    (ToastOverflowPolicy.DROP_OLDEST, [4, 5]),
+    (ToastOverflowPolicy.DROP_NEWEST, [1, 2]),
+    (lambda queue, toast: queue[-1], [1, 5])
+])
+def test_set_queue_overflow_policy(qtbot, policy, expected_queue):
+    """Test dropping toasts if the queue is full"""
+
+    assert Toast.getMaximumQueueSize() == 0
+    assert Toast.getQueueOverflowPolicy() == ToastOverflowPolicy.DROP_OLDEST
+
+    Toast.setMaximumQueueSize(2)
+    Toast.setQueueOverflowPolicy(policy)
+    assert Toast.getMaximumQueueSize() == 2
+    assert Toast.getQueueOverflowPolicy() == policy
+
+    toasts = create_queued_toasts(qtbot, 6)
+
+    assert [toasts.index(toast) for toast in Toast.getQueue()] == expected_queue
+    assert Toast.getDroppedCount() == 3
+
+
+def test_invalid_queue_overflow_policy(qtbot):
+    """Test a custom overflow policy that returns neither the new toast nor a queued toast"""
+
+    Toast.setMaximumQueueSize(2)
+    Toast.setQueueOverflowPolicy(lambda queue, toast: ToastSpec(text='x'))
+    create_queued_toasts(qtbot, 3)
+
+    with pytest.raises(ValueError):
+        Toast.showSpec(ToastSpec(text='overflow'))
+
+    assert Toast.getQueuedCount() == 2
+    assert Toast.getDroppedCount() == 0
+
+
+def test_queue_overflow_closes_dropped_toasts(qtbot):
+    """Test that dropped toasts are closed but not deleted"""
+
+    Toast.setMaximumOnScreen(1)
+    Toast.setMaximumQueueSize(1)
+
+    closed_toasts = []
+    toasts = [Toast() for i in range(3)]
+    for toast in toasts:
+        qtbot.addWidget(toast)
+        toast.closed.connect(lambda toast=toast: closed_toasts.append(toast))
+        toast.show()
+
+    assert closed_toasts == [toasts[1]]
+    assert list(Toast.getQueue()) == [toasts[2]]
+
+    # Dropped toasts still exist, but cannot be shown again
+    qtbot.wait(10)
+    assert toasts[1].isVisible() == False
+    toasts[1].show()
+    assert list(Toast.getQueue()) == [toasts[2]]
+
+
+def test_queue_overflow_summary(qtbot):
+    """Test collapsing the overflow of the queue into one summary toast"""
+
+    Toast.setMaximumQueueSize(3)
+    Toast.setQueueOverflowPolicy(ToastOverflowPolicy.SUMMARY)
+
+    toasts = create_queued_toasts(qtbot, 8)
+    queue = list(Toast.getQueue())
+
+    assert queue[:2] == toasts[1:3]
+    assert queue[2] not in toasts
+    assert queue[2].getText() == '5 more notifications'
+    assert Toast.getDroppedCount() == 5
+
+
+def test_show_spec(qtbot):
+    """Test showing toasts from specs that are only turned into toasts when shown"""
+
+    Toast.setMaximumOnScreen(1)
+    toast = Toast.showSpec(ToastSpec(title='title', text='text', duration=0,
+                                     preset=ToastPreset.ERROR, show_icon=True))
+    qtbot.addWidget(toast)
+
+    assert toast.isVisible() == True
+    assert toast.getTitle() == 'title'
+    assert toast.getText() == 'text'
+    assert toast.getDuration() == 0
+    assert toast.isShowIcon() == True
+    assert toast.getIconColor() == QColor('#BA2626')
+
+    for i in range(1000):
+        assert Toast.showSpec(ToastSpec(text=str(i), setup=lambda t: t.setFadeInDuration(0))) is None
+
+    assert Toast.getQueuedCount() == 1000
+    assert all(isinstance(spec, ToastSpec) for spec in Toast.getQueue())
+
+    toast.setFadeOutDuration(0)
+    toast.hide()
+    qtbot.waitUntil(lambda: Toast.getQueuedCount() == 999, timeout=1000)
+
+    next_toast = list(Toast._Toast__currently_shown)[0]
+    qtbot.addWidget(next_toast)
+    assert next_toast.getText() == '0'
+    assert next_toast.getFadeInDuration() == 0
+
+
+def test_show_spec_frees_toasts(qtbot):
+    """Test that toasts created from specs are returned to the pool once closed"""
+
+    def setup(toast: Toast):
+        toast.setFadeInDuration(0)
+        toast.setFadeOutDuration(0)
+
+    window = QMainWindow()
+    qtbot.addWidget(window)
+    Toast.setPoolSize(5)
+
+    for i in range(20):
+        Toast.showSpec(ToastSpec(text=str(i), duration=10, parent=window, setup=setup))
+
+    qtbot.waitUntil(lambda: Toast.getCount() == 0, timeout=3000)
+    qtbot.waitUntil(lambda: len(window.findChildren(Toast)) == 0, timeout=1000)
+    assert Toast.getPoolCount() == Toast.getPoolCreatedCount()
+    assert Toast.getPoolCreatedCount() + Toast.getPoolReusedCount() == 20
+
+
+def test_obtain(qtbot):
+    """Test reusing closed toasts from the pool"""
+
+    assert Toast.getPoolSize() == 10
+
+    toast = Toast.obtain()
+    closed_calls = []
+    toast.closed.connect(lambda: closed_calls.append(True))
+    toast.applyPreset(ToastPreset.ERROR_DARK)
+    toast.setTitle('title')
+    toast.setText('text that is long enough to be word wrapped ' * 3)
+    toast.setMaximumWidth(250)
+    toast.setShowIcon(True)
+    toast.setShowCloseButton(False)
+    toast.setFadeInDuration(0)
+    toast.setFadeOutDuration(0)
+    toast.show()
+
+    toast.hide()
+    qtbot.waitUntil(lambda: Toast.getPoolCount() == 1, timeout=1000)
+    assert len(closed_calls) == 1
+
+    # The reused toast behaves like a new one
+    reused_toast = Toast.obtain()
+    qtbot.addWidget(reused_toast)
+    assert reused_toast is toast
+    assert Toast.getPoolCount() == 0
+    assert Toast.getPoolCreatedCount() == 1
+    assert Toast.getPoolReusedCount() == 1
+    assert reused_toast.getTitle() == ''
+    assert reused_toast.isShowIcon() == False
+    assert reused_toast.isShowCloseButton() == True
+    assert reused_toast.getBackgroundColor() == QColor('#E7F4F9')
+    assert reused_toast.maximumWidth() == 16777215
+
+    new_toast = Toast()
+    qtbot.addWidget(new_toast)
+    for t in [reused_toast, new_toast]:
+        t.setText('text')
+        t.setFadeInDuration(0)
+        t.setFadeOutDuration(0)
+        t.show()
+    assert reused_toast.size() == new_toast.size()
+
+    reused_toast.hide()
+    qtbot.waitUntil(lambda: Toast.getPoolCount() == 1, timeout=1000)
+    assert len(closed_calls) == 1
+
+    Toast.setPoolSize(0)
+    assert Toast.getPoolSize() == 0
+    assert Toast.getPoolCount() == 0
+
+
+def test_release(qtbot):
+    """Test that released toasts are not deleted and keep their slots until they are reused"""
+
+    def show_and_close(toast: Toast):
+        toast.setFadeInDuration(0)
+        toast.setFadeOutDuration(0)
+        toast.show()
+        toast.hide()
+
+    # Toasts that do not fit into the pool are not deleted
+    Toast.setPoolSize(0)
+    toast = Toast.obtain()
+    qtbot.addWidget(toast)
+    show_and_close(toast)
+    qtbot.waitUntil(lambda: toast not in Toast._Toast__currently_shown, timeout=1000)
+    qtbot.wait(10)
+    assert toast.isVisible() == False
+    assert Toast.getPoolCount() == 0
+
+    # Slots stay connected until the toast is obtained again
+    Toast.setPoolSize(1)
+    closed_calls = []
+    toast = Toast.obtain()
+    toast.closed.connect(lambda: closed_calls.append(True))
+    show_and_close(toast)
+    qtbot.waitUntil(lambda: Toast.getPoolCount() == 1, timeout=1000)
+    assert len(closed_calls) == 1
+
+    toast.closed.emit()
+    assert len(closed_calls) == 2
+
+    reused_toast = Toast.obtain()
+    qtbot.addWidget(reused_toast)
+    assert reused_toast is toast
+    reused_toast.closed.emit()
+    assert len(closed_calls) == 2
+
+
+def test_prewarm(qtbot):
+    """Test preparing caches and pooled toasts ahead of time"""
+
+    timings = Toast.prewarm(pool_size=2)
+
+    assert set(timings) == {'icons', 'recolored_icons', 'stylesheets', 'fonts', 'pool'}
+    assert all(timing >= 0 for timing in timings.values())
+    assert Toast.getPoolCount() == 2
+
+    toast = Toast.obtain()
+    qtbot.addWidget(toast)
+    assert Toast.getPoolReusedCount() == 1
+    assert Toast.getPoolCreatedCount() == 0
+
+
+def test_prewarm_recolored_icons(qtbot):
+    """Test that new toasts do not have to recolor any icons after prewarming"""
+
+    IconUtils.clear_cache()
+    Toast.prewarm()
+    cache_misses = IconUtils.get_cache_misses()
+
+    toast = Toast()
+    qtbot.addWidget(toast)
+    assert IconUtils.get_cache_misses() == cache_misses
+
+
+def test_prewarm_incremental(qtbot):
+    """Test preparing caches and pooled toasts in multiple event loop iterations"""
+
+    results = []
+    Toast.setPoolSize(12)
+    assert Toast.prewarm(pool_size=12, incremental=True, callback=results.append) is None
+    assert Toast.getPoolCount() == 0
+
+    qtbot.waitUntil(lambda: len(results) == 1, timeout=5000)
+    assert results[0]['pool'] > 0
+    assert Toast.getPoolCount() == 12
+
+
+def test_prewarm_pool_size(qtbot):
+    """Test that prewarming does not change the pool size"""
+
+    Toast.prewarm(pool_size=15)
+    assert Toast.getPoolSize() == 10
+    assert Toast.getPoolCount() == 10
+
+
+def test_show_many(qtbot):
+    """Test showing many toasts and toast specs with one restack"""
+
+    toasts = [Toast() for i in range(2)]
+    for toast in toasts:
+        qtbot.addWidget(toast)
+        toast.setDuration(0)
+    specs = [ToastSpec(text=str(i), duration=0) for i in range(3)]
+
+    restack = Toast._Toast__restack
+    with patch.object(Toast, '_Toast__restack', side_effect=restack) as mock_restack:
+        shown_toasts = Toast.showMany([toasts[0], specs[0], toasts[1], specs[1], specs[2]])
+        assert mock_restack.call_count == 1
+
+    for toast in shown_toasts:
+        qtbot.addWidget(toast)
+
+    assert len(shown_toasts) == 3
+    assert shown_toasts[0] is toasts[0]
+    assert shown_toasts[1].getText() == '0'
+    assert shown_toasts[2] is toasts[1]
+    assert all(toast.isVisible() for toast in shown_toasts)
+    assert list(Toast.getQueue()) == specs[1:]
+
+    # Already shown toasts are skipped
+    assert Toast.showMany([toasts[0]]) == []
+    assert Toast.getQueuedCount() == 2
+
+    # Toasts end up at the stack positions
+    qtbot.waitUntil(lambda: Toast._Toast__restack_animation.state()
+                    == QAbstractAnimation.State.Stopped, timeout=1000)
+    assert [toast.pos() for toast in shown_toasts] == Toast.getStackPositions()
+
+
+def test_post(qtbot):
+    """Test posting toast specs from other threads"""
+
+    def post_specs(thread_index: int):
+        for i in range(50):
+            Toast.post(ToastSpec(text='{} {}'.format(thread_index, i), duration=0))
+
+    batch_sizes = []
+
+    def show_posted(specs):
+        batch_sizes.append(len(specs))
+        Toast.showMany(specs)
+
+    with patch.object(Toast, '_Toast__show_posted', side_effect=show_posted):
+        # The very first post comes from a worker thread
+        threads = [threading.Thread(target=post_specs, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        qtbot.waitUntil(lambda: Toast.getCount() == 200, timeout=1000)
+
+    # Specs posted before the GUI thread drained the inbox are shown as one batch
+    assert Toast._Toast__inbox.thread() is QGuiApplication.instance().thread()
+    assert sum(batch_sizes) == 200
+    assert len(batch_sizes) < 200
+    assert Toast.getVisibleCount() == 3
+
+    for toast in Toast._Toast__currently_shown:
+        qtbot.addWidget(toast)
+
+
 def test_set_maximum_on_screen(qtbot):
     """Test setting the maximum number of toasts on screen"""
 
@@ -510,6 +886,286 @@ def test_set_position_center(qtbot):
     assert toast.pos().y() == pos_y
 
 
+def test_set_frame_rate(qtbot):
+    """Test setting the frame rate of the duration bar animation"""
+
+    assert Toast.getFrameRate() == 0
+
+    Toast.setFrameRate(30)
+    assert Toast.getFrameRate() == 30
+
+    toast = Toast()
+    toast.setDuration(2000)
+    toast.setFadeInDuration(0)
+    toast.setFadeOutDuration(0)
+
+    # Count the duration bar updates while the toast is shown
+    updates = []
+    update_duration_bar = Toast._Toast__update_duration_bar
+    with patch.object(Toast, '_Toast__update_duration_bar', autospec=True,
+                      side_effect=lambda t: updates.append(update_duration_bar(t))):
+        elapsed_timer = QElapsedTimer()
+        elapsed_timer.start()
+        toast.show()
+        qtbot.addWidget(toast)
+
+        ticker = Toast._Toast__duration_bar_ticker
+        assert ticker.interval() == 33
+        qtbot.wait(300)
+        assert 0 < len(updates) <= elapsed_timer.elapsed() / 33 + 1
+
+    # Without a frame rate the refresh rate of the screen is used
+    Toast.setFrameRate(0)
+    refresh_rate = QGuiApplication.primaryScreen().refreshRate()
+    assert ticker.interval() == round(1000 / (refresh_rate if refresh_rate > 0 else 60))
+
+    toast.hide()
+    qtbot.waitUntil(lambda: not toast.isVisible(), timeout=1000)
+
+
+def test_shared_duration_bar_ticker(qtbot):
+    """Test that all duration bars are driven by one timer
+     that stops as soon as no duration bar is animated"""
+
+    toast_1 = Toast()
+    toast_2 = Toast()
+    for toast in [toast_1, toast_2]:
+        toast.setDuration(100)
+        toast.setFadeInDuration(0)
+        toast.setFadeOutDuration(0)
+        toast.show()
+        qtbot.addWidget(toast)
+
+    ticker = Toast._Toast__duration_bar_ticker
+    assert ticker.isActive() == True
+
+    qtbot.waitUntil(lambda: not toast_1.isVisible() and not toast_2.isVisible(), timeout=1000)
+    assert Toast._Toast__duration_bar_ticker is ticker
+    assert ticker.isActive() == False
+
+
+def test_position_animation_reused(qtbot):
+    """Test that position changes retarget the existing animation of a toast"""
+
+    toasts = []
+    for i in range(3):
+        toast = Toast()
+        toast.setDuration(0)
+        toast.setFadeInDuration(0)
+        toast.setFadeOutDuration(0)
+        toast.show()
+        qtbot.addWidget(toast)
+        toasts.append(toast)
+
+    animations = [toast._Toast__pos_animation for toast in toasts]
+
+    toasts[0].hide()
+    qtbot.waitUntil(lambda: not toasts[0].isVisible(), timeout=1000)
+
+    assert [toast._Toast__pos_animation for toast in toasts] == animations
+    for toast in toasts[1:]:
+        qtbot.waitUntil(lambda: toast.pos() == toast._Toast__pos_animation.endValue(), timeout=1000)
+
+
+def test_restack_animation_group(qtbot):
+    """Test that all visible toasts are moved by one shared animation group"""
+
+    toasts = []
+    for i in range(3):
+        toast = Toast()
+        toast.setDuration(0)
+        toast.setFadeInDuration(0)
+        toast.setFadeOutDuration(0)
+        toast.show()
+        qtbot.addWidget(toast)
+        toasts.append(toast)
+
+    group = Toast._Toast__restack_animation
+    assert group.animationCount() == 3
+    assert all(toast._Toast__pos_animation.group() is group for toast in toasts)
+
+    toasts[0].hide()
+    qtbot.waitUntil(lambda: not toasts[0].isVisible(), timeout=1000)
+
+    assert Toast._Toast__restack_animation is group
+    assert group.animationCount() == 2
+    assert toasts[0]._Toast__pos_animation.group() is None
+
+
+def test_get_stack_positions(qtbot):
+    """Test getting the target positions of all currently shown toasts"""
+
+    assert Toast.getStackPositions() == []
+
+    toasts = []
+    for i in range(3):
+        toast = Toast()
+        toast.setDuration(0)
+        toast.setFadeInDuration(0)
+        toast.show()
+        qtbot.addWidget(toast)
+        toasts.append(toast)
+
+    positions = Toast.getStackPositions()
+    assert len(positions) == 3
+    for toast, position in zip(toasts, positions):
+        qtbot.waitUntil(lambda: toast.pos() == position, timeout=1000)
+    assert positions[1].y() == positions[0].y() - toasts[1].height() + 2 * DROP_SHADOW_SIZE - 10
+
+
+def test_bounds_cache(qtbot):
+    """Test that the bounds are reused until a screen or setting changes"""
+
+    toast = Toast()
+    toast.setFadeInDuration(0)
+    toast.show()
+    qtbot.addWidget(toast)
+
+    bounds_cache = Toast._Toast__bounds_cache
+    assert len(bounds_cache) == 1
+    bounds = list(bounds_cache.values())[0]
+
+    Toast.getStackPositions()
+    assert list(bounds_cache.values())[0] is bounds
+
+    primary_screen = QGuiApplication.primaryScreen()
+    primary_screen.geometryChanged.emit(primary_screen.geometry())
+    assert len(bounds_cache) == 0
+
+    Toast.getStackPositions()
+    bounds = list(bounds_cache.values())[0]
+
+    # Changing a setting also invalidates the bounds (positions are updated right away)
+    Toast.setFixedScreen(primary_screen)
+    assert len(bounds_cache) == 1
+    assert list(bounds_cache.values())[0] is not bounds
+
+
+def test_shared_anchor_watcher(qtbot):
+    """Test that the widget the position is relative to is watched once for all toasts"""
+
+    window = QMainWindow()
+    window.setGeometry(100, 100, 400, 300)
+    window.show()
+    qtbot.addWidget(window)
+
+    Toast.setPositionRelativeToWidget(window)
+    toasts = [Toast() for i in range(5)]
+    for toast in toasts:
+        qtbot.addWidget(toast)
+
+    anchor_watcher = Toast._Toast__anchor_watcher
+    assert anchor_watcher.get_widget() is window
+
+    Toast.setMovePositionWithWidget(False)
+    assert anchor_watcher.get_widget() is None
+
+    Toast.setMovePositionWithWidget(True)
+    assert anchor_watcher.get_widget() is window
+
+    Toast.reset()
+    assert Toast._Toast__anchor_watcher is anchor_watcher
+    assert anchor_watcher.get_widget() is None
+
+
+def test_set_coalesce_widget_events(qtbot):
+    """Test coalescing the position updates of many widget moves / resizes into one"""
+
+    window = QMainWindow()
+    window.show()
+    qtbot.addWidget(window)
+    Toast.setPositionRelativeToWidget(window)
+    anchor_watcher = Toast._Toast__anchor_watcher
+
+    assert Toast.isCoalesceWidgetEvents() == False
+
+    with patch.object(Toast, '_Toast__update_currently_showing_position_xy') as update:
+        for i in range(5):
+            anchor_watcher.changed.emit()
+        assert update.call_count == 5
+
+        Toast.setCoalesceWidgetEvents(True)
+        assert Toast.isCoalesceWidgetEvents() == True
+
+        update.reset_mock()
+        for i in range(5):
+            anchor_watcher.changed.emit()
+        assert update.call_count == 0
+        qtbot.waitUntil(lambda: update.call_count == 1, timeout=1000)
+
+        # Disabling applies a pending update right away
+        anchor_watcher.changed.emit()
+        Toast.setCoalesceWidgetEvents(False)
+        assert update.call_count == 2
+
+
+def test_set_default_stylesheet(qtbot):
+    """Test overriding the default stylesheet of the toasts"""
+
+    with open(ROOT_PATH + '/src/pyqttoast/css/toast.css') as file:
+        default_stylesheet = file.read()
+
+    assert Toast.getDefaultStyleSheet() == default_stylesheet
+
+    Toast.setDefaultStyleSheet('#toast-close-button { background: red; }')
+    toast = Toast()
+    qtbot.addWidget(toast)
+    assert toast.styleSheet() == '#toast-close-button { background: red; }'
+
+    Toast.setDefaultStyleSheet(None)
+    assert Toast.getDefaultStyleSheet() == default_stylesheet
+
+
+def test_set_fade_backend(qtbot):
+    """Test setting the fade backend of the fade in and fade out animations"""
+
+    assert Toast.getFadeBackend() == ToastFadeBackend.GRAPHICS_EFFECT
+    assert Toast.getActiveFadeBackend() == ToastFadeBackend.GRAPHICS_EFFECT
+
+    Toast.setFadeBackend(ToastFadeBackend.WINDOW_OPACITY)
+    assert Toast.getFadeBackend() == ToastFadeBackend.WINDOW_OPACITY
+
+    with patch.object(Utils, 'is_window_opacity_supported', return_value=True):
+        assert Toast.getActiveFadeBackend() == ToastFadeBackend.WINDOW_OPACITY
+
+        toast = Toast()
+        toast.setFadeInDuration(50)
+        toast.show()
+        qtbot.addWidget(toast)
+
+        assert toast.graphicsEffect() is None
+        qtbot.waitUntil(lambda: toast.windowOpacity() == 1, timeout=1000)
+
+    # Fall back to the graphics effect if the window opacity is not supported
+    with patch.object(Utils, 'is_window_opacity_supported', return_value=False):
+        assert Toast.getActiveFadeBackend() == ToastFadeBackend.GRAPHICS_EFFECT
+
+    for platform_name in ['offscreen', 'wayland', 'wayland-egl']:
+        with patch.object(QGuiApplication, 'platformName', return_value=platform_name):
+            assert Toast.getActiveFadeBackend() == ToastFadeBackend.GRAPHICS_EFFECT
+
+    with patch.object(QGuiApplication, 'platformName', return_value='xcb'):
+        assert Toast.getActiveFadeBackend() == ToastFadeBackend.WINDOW_OPACITY
+
+
+def test_set_fade_backend_none(qtbot):
+    """Test showing and hiding a toast without fade animations"""
+
+    Toast.setFadeBackend(ToastFadeBackend.NONE)
+    assert Toast.getActiveFadeBackend() == ToastFadeBackend.NONE
+
+    toast = Toast()
+    toast.show()
+    qtbot.addWidget(toast)
+
+    assert toast.graphicsEffect() is None
+    assert toast.isVisible() == True
+
+    toast.hide()
+    assert toast.isVisible() == False
+    assert Toast.getVisibleCount() == 0
+
+
 def test_reset(qtbot):
     """Test resetting the Toast class"""
 
@@ -521,6 +1177,12 @@ def test_reset(qtbot):
     Toast.setAlwaysOnMainScreen(True)
     Toast.setFixedScreen(QGuiApplication.primaryScreen())
     Toast.setPosition(ToastPosition.CENTER)
+    Toast.setDefaultStyleSheet('')
+    Toast.setFrameRate(24)
+    Toast.setFadeBackend(ToastFadeBackend.NONE)
+    Toast.setCoalesceWidgetEvents(True)
+    Toast.setMaximumQueueSize(5)
+    Toast.setQueueOverflowPolicy(ToastOverflowPolicy.SUMMARY)
 
     toast = Toast()
     qtbot.addWidget(toast)
@@ -535,6 +1197,13 @@ def test_reset(qtbot):
     assert Toast.isAlwaysOnMainScreen() == False
     assert Toast.getFixedScreen() is None
     assert Toast.getPosition() == ToastPosition.BOTTOM_RIGHT
+    assert Toast.getDefaultStyleSheet() != ''
+    assert Toast.getFrameRate() == 0
+    assert Toast.getFadeBackend() == ToastFadeBackend.GRAPHICS_EFFECT
+    assert Toast.isCoalesceWidgetEvents() == False
+    assert Toast.getMaximumQueueSize() == 0
+    assert Toast.getQueueOverflowPolicy() == ToastOverflowPolicy.DROP_OLDEST
+    assert Toast.getDroppedCount() == 0
     assert Toast.getCount() == 0
     assert Toast.getQueuedCount() == 0
     assert Toast.getVisibleCount() == 0
@@ -604,6 +1273,15 @@ def test_set_icon(qtbot):
     toast.setIcon(ERROR_PIXMAP)
     assert toast.getIcon().toImage() == ERROR_PIXMAP.toImage()
 
+    Toast.registerIcon('custom-icon', ERROR_PIXMAP)
+    toast.setIcon(ToastIcon.SUCCESS)
+    toast.setIcon('custom-icon')
+    assert toast.getIcon().toImage() == ERROR_PIXMAP.toImage()
+
+    # Strings that are not registered names are loaded as paths
+    toast.setIcon(ROOT_PATH + '/src/pyqttoast/icons/success.png')
+    assert toast.getIcon().toImage() == SUCCESS_PIXMAP.toImage()
+
 
 def test_set_show_icon(qtbot):
     """Test enabling icon of a toast"""
@@ -706,6 +1384,9 @@ def test_set_close_button_icon(qtbot):
     toast.setCloseButtonIcon(close_pixmap)
     assert toast.getCloseButtonIcon().toImage() == close_pixmap.toImage()
 
+    toast.setCloseButtonIcon(ROOT_PATH + '/src/pyqttoast/icons/error.png')
+    assert toast.getCloseButtonIcon().toImage() == error_pixmap.toImage()
+
 
 def test_set_show_close_button(qtbot):
     """Test disabling the close button of a toast"""
@@ -1031,6 +1712,24 @@ def test_set_maximum_width_height(qtbot):
     assert toast.height() == 100 + 2 * DROP_SHADOW_SIZE
 
 
+def test_layout_calculation_without_side_effects(qtbot):
+    """Test that calculating the layout of a word wrapped toast does not change its widgets"""
+
+    toast = Toast()
+    qtbot.addWidget(toast)
+    toast.setMaximumWidth(200)
+    toast.setTitle('A title that is too long for the toast')
+    toast.setText('A text that is also too long for the toast and has to be word wrapped')
+
+    with patch.object(Toast, '_Toast__apply_layout'):
+        toast._Toast__setup_ui()
+
+    layout = toast._Toast__layout
+    assert layout.word_wrap == True
+    assert layout.width == 200
+    assert all(not label.wordWrap() and label.minimumWidth() == 0 for label in toast.findChildren(QLabel))
+
+
 def test_set_minimum_width_height(qtbot):
     """Test setting a minimum width and height on a toast"""
 
@@ -1044,6 +1743,137 @@ def test_set_minimum_width_height(qtbot):
     assert toast.height() == 250 + 2 * DROP_SHADOW_SIZE
 
 
+def calculate_minimum_height_size_linear(toast: Toast, minimum_height: int) -> QSize:
+    """Reference implementation of the minimum height layout
+    (increases the text width pixel by pixel)"""
+
+    def calculate_height(title_height, text_height):
+        text_section_height = title_height + toast.getTextSectionSpacing() + text_height
+        return (toast.getMarginTop() + max(text_section_height, close_button_section_height)
+                + toast.getMarginBottom() + 4)
+
+    def calculate_width(text_width):
+        return (toast.getMarginLeft() + text_width + toast.getTextSectionMarginRight()
+                + toast.getCloseButtonWidth() + toast.getMarginRight())
+
+    def measure(font, text, width):
+        rect = QFontMetrics(font).boundingRect(QRect(0, 0, width, 0), Qt.TextFlag.TextWordWrap, text)
+        return rect.width(), rect.height()
+
+    close_button_section_height = (toast.getCloseButtonMarginTop() + toast.getCloseButtonHeight()
+                                   + toast.getCloseButtonMarginBottom())
+    title_font = toast.getTitleFont()
+    text_font = toast.getTextFont()
+    width = calculate_width(max(QFontMetrics(title_font).horizontalAdvance(toast.getTitle()),
+                                QFontMetrics(text_font).horizontalAdvance(toast.getText())))
+
+    temp_width = max(measure(title_font, toast.getTitle(), 0)[0],
+                     measure(text_font, toast.getText(), 0)[0])
+    title_width, title_height = measure(title_font, toast.getTitle(), temp_width)
+    text_width, text_height = measure(text_font, toast.getText(), temp_width)
+    height = calculate_height(title_height, text_height)
+
+    while temp_width <= width:
+        temp_title_width, temp_title_height = measure(title_font, toast.getTitle(), temp_width)
+        temp_text_width, temp_text_height = measure(text_font, toast.getText(), temp_width)
+        temp_height = calculate_height(temp_title_height, temp_text_height)
+
+        if temp_height >= minimum_height:
+            title_width, text_width, height = temp_title_width, temp_text_width, temp_height
+            temp_width += 1
+        else:
+            break
+
+    return QSize(calculate_width(max(title_width, text_width)) + 2 * DROP_SHADOW_SIZE,
+                 max(height, minimum_height) + 2 * DROP_SHADOW_SIZE)
+
+
+@pytest.mark.parametrize('minimum_height', [90, 120, 160, 220, 400])
+def test_minimum_height_layout(qtbot, minimum_height):
+    """Test that the minimum height layout matches the pixel by pixel reference"""
+
+    toast = Toast()
+    toast.setTitle('Synchronization complete')
+    toast.setText('All 1,284 files were uploaded to the remote storage and verified '
+                  'successfully. You can now safely close the application.')
+    toast.setMinimumHeight(minimum_height)
+    toast.show()
+    qtbot.addWidget(toast)
+
+    assert toast.size() == calculate_minimum_height_size_linear(toast, minimum_height)
+
+
+def test_set_render_mode(qtbot):
+    """Test setting the render mode of a toast"""
+
+    toast = Toast()
+    toast.setDuration(100)
+    toast.setFadeInDuration(0)
+    toast.setFadeOutDuration(0)
+    toast.setRenderMode(ToastRenderMode.SINGLE_PAINT)
+    toast.show()
+    qtbot.addWidget(toast)
+
+    assert toast.getRenderMode() == ToastRenderMode.SINGLE_PAINT
+    assert toast.isVisible() == True
+
+    # Only the toast widget and the close button are created
+    assert len(toast.findChildren(QLabel)) == 1
+    assert len(toast.findChildren(QPushButton)) == 1
+    qtbot.waitUntil(lambda: not toast.isVisible(), timeout=1000)
+
+
+@pytest.mark.parametrize('render_mode', [ToastRenderMode.WIDGETS, ToastRenderMode.SINGLE_PAINT])
+def test_duration_bar_progress(qtbot, render_mode):
+    """Test that the duration bar chunk shrinks from the full width of the bar"""
+
+    toast = Toast()
+    toast.setDuration(10000)
+    toast.setFadeInDuration(0)
+    toast.setText('Uploading files...')
+    toast.setRenderMode(render_mode)
+    toast.show()
+    qtbot.addWidget(toast)
+
+    bar_width = toast._Toast__layout.duration_bar.width
+    assert toast._Toast__duration_bar_chunk_width == bar_width
+
+    qtbot.wait(200)
+    chunk_width = toast._Toast__duration_bar_chunk_width
+    assert bar_width * 0.9 < chunk_width < bar_width
+
+
+@pytest.mark.parametrize('preset, border_radius, minimum_height', [
+    (None, 0, 0),
+    (ToastPreset.SUCCESS, 0, 0),
+    (ToastPreset.ERROR_DARK, 6, 0),
+    (ToastPreset.INFORMATION, 3, 150)
+])
+def test_single_paint_render_mode_visual_parity(qtbot, preset, border_radius, minimum_height):
+    """Test that the single paint mode looks the same as the widget mode"""
+
+    def render(render_mode: ToastRenderMode) -> QImage:
+        Toast.reset()
+        toast = Toast()
+        toast.setDuration(0)
+        toast.setFadeInDuration(0)
+        toast.setTitle('Build finished')
+        toast.setText('All 1,284 files were uploaded.')
+        if preset is not None:
+            toast.applyPreset(preset)
+        toast.setBorderRadius(border_radius)
+        toast.setMinimumHeight(minimum_height)
+        toast.setRenderMode(render_mode)
+        toast.show()
+        qtbot.addWidget(toast)
+        return toast.grab().toImage().convertToFormat(QImage.Format.Format_ARGB32)
+
+    widgets_image = render(ToastRenderMode.WIDGETS)
+    single_paint_image = render(ToastRenderMode.SINGLE_PAINT)
+    assert widgets_image.size() == single_paint_image.size()
+    assert widgets_image == single_paint_image
+
+
 def test_apply_preset_light(qtbot):
     """Test applying light theme presets on a toast"""
 